@@ -14,6 +14,26 @@ from .types import (
 )
 from .registry import BaseAnalyzer, analyzer_registry
 
+# Word lists for metric-based sentiment scoring
+POSITIVE_WORDS = frozenset({
+    "good", "great", "excellent", "happy", "positive",
+    "wonderful", "fantastic", "amazing", "helpful"
+})
+NEGATIVE_WORDS = frozenset({
+    "bad", "poor", "terrible", "unhappy", "negative",
+    "awful", "horrible", "useless", "disappointing"
+})
+
+# Words ignored when computing topic distribution
+COMMON_WORDS = frozenset({
+    "the", "be", "to", "of", "and", "a", "in", "that",
+    "have", "i", "it", "for", "not", "on", "with", "he",
+    "as", "you", "do", "at"
+})
+
+# Sentence body followed by its terminating punctuation
+SENTENCE_PATTERN = re.compile(r'([^.!?]+)([.!?]*)')
+
 
 class SentimentAnalyzer(BaseAnalyzer):
     """Analyzes sentiment in content."""
@@ -78,7 +98,7 @@ class SentimentAnalyzer(BaseAnalyzer):
         # Add basic sentiment metrics
         insights.append(AnalysisInsight(
             type=AnalysisType.SENTIMENT,
-            content=await self._calculate_sentiment_metrics(text),
+            content=self._calculate_sentiment_metrics(text),
             confidence=0.7,
             source="metric_analysis",
             timestamp=datetime.now()
@@ -86,7 +106,7 @@ class SentimentAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _calculate_sentiment_metrics(
+    def _calculate_sentiment_metrics(
             self,
             text: str
     ) -> Dict[str, Any]:
@@ -99,18 +119,9 @@ class SentimentAnalyzer(BaseAnalyzer):
             Sentiment metrics
         """
         # Simple word-based sentiment scoring
-        positive_words = {
-            "good", "great", "excellent", "happy", "positive",
-            "wonderful", "fantastic", "amazing", "helpful"
-        }
-        negative_words = {
-            "bad", "poor", "terrible", "unhappy", "negative",
-            "awful", "horrible", "useless", "disappointing"
-        }
-
         words = text.lower().split()
-        positive_count = sum(1 for w in words if w in positive_words)
-        negative_count = sum(1 for w in words if w in negative_words)
+        positive_count = sum(1 for w in words if w in POSITIVE_WORDS)
+        negative_count = sum(1 for w in words if w in NEGATIVE_WORDS)
 
         total = positive_count + negative_count
         if total == 0:
@@ -196,7 +207,7 @@ class TopicAnalyzer(BaseAnalyzer):
         # Add statistical topic analysis
         insights.append(AnalysisInsight(
             type=AnalysisType.TOPIC,
-            content=await self._analyze_topic_distribution(text),
+            content=self._analyze_topic_distribution(text),
             confidence=0.8,
             source="statistical_analysis",
             timestamp=datetime.now()
@@ -204,7 +215,7 @@ class TopicAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _analyze_topic_distribution(
+    def _analyze_topic_distribution(
             self,
             text: str
     ) -> Dict[str, Any]:
@@ -217,19 +228,10 @@ class TopicAnalyzer(BaseAnalyzer):
             Topic distribution metrics
         """
         # Remove common words and get word frequencies
-        common_words = {
-            "the", "be", "to", "of", "and", "a", "in", "that",
-            "have", "i", "it", "for", "not", "on", "with", "he",
-            "as", "you", "do", "at"
-        }
-
-        words = [
-            word.lower() for word in re.findall(r'\w+', text)
-            if word.lower() not in common_words
-        ]
-
-        # Get word frequencies
-        word_freq = Counter(words)
+        word_freq = Counter(
+            word for word in re.findall(r'\w+', text.lower())
+            if word not in COMMON_WORDS
+        )
         top_words = word_freq.most_common(10)
 
         # Group similar words (simple stemming)
@@ -248,7 +250,7 @@ class TopicAnalyzer(BaseAnalyzer):
         return {
             "top_words": dict(top_words),
             "topic_groups": grouped_topics,
-            "total_words": len(words)
+            "total_words": sum(word_freq.values())
         }
 
 
@@ -323,7 +325,7 @@ class QualityAnalyzer(BaseAnalyzer):
         # Add measurable quality metrics
         insights.append(AnalysisInsight(
             type=AnalysisType.QUALITY,
-            content=await self._calculate_quality_metrics(text),
+            content=self._calculate_quality_metrics(text),
             confidence=0.9,
             source="metric_analysis",
             timestamp=datetime.now()
@@ -331,7 +333,7 @@ class QualityAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _calculate_quality_metrics(
+    def _calculate_quality_metrics(
             self,
             text: str
     ) -> Dict[str, Any]:
@@ -343,19 +345,26 @@ class QualityAnalyzer(BaseAnalyzer):
         Returns:
             Quality metrics
         """
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Scan sentences in place, keeping their terminators
+        sentence_count = 0
+        word_count = 0
+        questions = 0
+        for match in SENTENCE_PATTERN.finditer(text):
+            sentence_words = len(match.group(1).split())
+            if not sentence_words:
+                continue
+            sentence_count += 1
+            word_count += sentence_words
+            if '?' in match.group(2):
+                questions += 1
 
         # Calculate metrics
         avg_sentence_length = (
-            sum(len(s.split()) for s in sentences) /
-            len(sentences) if sentences else 0
+            word_count / sentence_count if sentence_count else 0
         )
 
         # Check for question-response pairs
-        questions = sum(1 for s in sentences if '?' in s)
-        responses = len(sentences) - questions
+        responses = sentence_count - questions
 
         # Calculate turn-taking ratio
         turn_ratio = (
@@ -369,7 +378,7 @@ class QualityAnalyzer(BaseAnalyzer):
             "turn_taking_ratio": turn_ratio,
             "question_count": questions,
             "response_count": responses,
-            "total_turns": len(sentences)
+            "total_turns": sentence_count
         }
 
 
@@ -15,7 +15,16 @@ from .types import (
     AnalysisResult
 )
 from .registry import BaseAnalyzer, analyzer_registry
-from ..events.types import Event
+from ..events.types import Event, EventType
+
+
+# Risk indicator patterns, matched case-insensitively
+RISK_PATTERNS = {
+    "pii_exposure": r"\b(?:ssn|passport|credit.?card)\b",
+    "confidential": r"\b(?:confidential|classified|restricted)\b",
+    "financial": r"\b(?:account.?number|routing.?number)\b",
+    "security": r"\b(?:password|credentials|authentication)\b"
+}
 
 
 class ComplianceAnalyzer(BaseAnalyzer):
@@ -39,6 +48,14 @@ class ComplianceAnalyzer(BaseAnalyzer):
             'medium': 0.5,
             'low': 0.2
         })
+        # Single alternation so the text is scanned once for all risk types
+        self._risk_pattern = re.compile(
+            "|".join(
+                f"(?P<{risk_type}>{pattern})"
+                for risk_type, pattern in RISK_PATTERNS.items()
+            ),
+            re.IGNORECASE
+        )
 
     async def analyze(
             self,
@@ -105,7 +122,7 @@ class ComplianceAnalyzer(BaseAnalyzer):
         ))
 
         # Add rule-based compliance checks
-        compliance_checks = await self._check_compliance_rules(
+        compliance_checks = self._check_compliance_rules(
             text,
             role
         )
@@ -119,7 +136,7 @@ class ComplianceAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _check_compliance_rules(
+    def _check_compliance_rules(
             self,
             text: str,
             role: str
@@ -139,35 +156,40 @@ class ComplianceAnalyzer(BaseAnalyzer):
             "risk_indicators": []
         }
 
+        # Tokenize once for all keyword rules
+        words = set(text.lower().split())
+
         # Check role-specific rules
         role_rules = self.compliance_rules.get(role, [])
         for rule in role_rules:
-            check_result = await self._apply_rule(text, rule)
+            check_result = self._apply_rule(text, words, rule)
             if check_result:
                 results["role_specific_checks"].append(check_result)
 
         # Check general rules
         general_rules = self.compliance_rules.get("general", [])
         for rule in general_rules:
-            check_result = await self._apply_rule(text, rule)
+            check_result = self._apply_rule(text, words, rule)
             if check_result:
                 results["general_checks"].append(check_result)
 
         # Check risk indicators
-        risk_indicators = await self._check_risk_indicators(text)
+        risk_indicators = self._check_risk_indicators(text)
         results["risk_indicators"] = risk_indicators
 
         return results
 
-    async def _apply_rule(
+    def _apply_rule(
             self,
             text: str,
+            words: Set[str],
             rule: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Apply compliance rule.
 
         Args:
             text: Text to check
+            words: Lowercased words of the text
             rule: Rule definition
 
         Returns:
@@ -195,11 +217,7 @@ class ComplianceAnalyzer(BaseAnalyzer):
                 }
 
         elif rule_type == "keyword":
-            keywords = set(pattern.split("|"))
-            found = set()
-            for word in text.lower().split():
-                if word in keywords:
-                    found.add(word)
+            found = words.intersection(pattern.split("|"))
             if found:
                 return {
                     "rule": rule.get("name"),
@@ -210,7 +228,7 @@ class ComplianceAnalyzer(BaseAnalyzer):
 
         return None
 
-    async def _check_risk_indicators(
+    def _check_risk_indicators(
             self,
             text: str
     ) -> List[Dict[str, Any]]:
@@ -223,25 +241,17 @@ class ComplianceAnalyzer(BaseAnalyzer):
             List of risk indicators
         """
         indicators = []
-        risk_patterns = {
-            "pii_exposure": r"\b(?:ssn|passport|credit.?card)\b",
-            "confidential": r"\b(?:confidential|classified|restricted)\b",
-            "financial": r"\b(?:account.?number|routing.?number)\b",
-            "security": r"\b(?:password|credentials|authentication)\b"
-        }
-
-        for risk_type, pattern in risk_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                indicators.append({
-                    "type": risk_type,
-                    "text": match.group(),
-                    "position": match.start(),
-                    "severity": self._assess_risk_severity(
-                        risk_type,
-                        match.group()
-                    )
-                })
+        for match in self._risk_pattern.finditer(text):
+            risk_type = match.lastgroup
+            indicators.append({
+                "type": risk_type,
+                "text": match.group(),
+                "position": match.start(),
+                "severity": self._assess_risk_severity(
+                    risk_type,
+                    match.group()
+                )
+            })
 
         return indicators
 
@@ -321,7 +331,7 @@ class AnalysisAggregator:
 
         # Emit update event
         await self.event_bus.publish(Event(
-            type="analysis_update",
+            type=EventType.ANALYSIS,
             data={
                 "session_id": session_id,
                 "scores": self.get_scores(session_id),
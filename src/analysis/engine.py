@@ -2,6 +2,8 @@
 from typing import Dict, Any, List, Optional, Set, AsyncIterator
 from datetime import datetime
 import asyncio
+import logging
+import time
 import uuid
 
 from src.events.bus import EventBus
@@ -32,6 +34,8 @@ from .exceptions import (
     AnalysisResourceError, AnalyzerNotFoundError
 )
 
+logger = logging.getLogger(__name__)
+
 
 class AnalysisEngine:
     """Manages analysis tasks and pipelines."""
@@ -402,7 +406,7 @@ class AnalysisEngine:
                 self.active_tasks[task.id]["state"] = AnalysisState.RUNNING
 
                 # Process task
-                start_time = datetime.now()
+                start_time = time.monotonic()
                 try:
                     # Execute analysis
                     result = await self._execute_analysis(
@@ -440,9 +444,7 @@ class AnalysisEngine:
                         data={
                             "status": "task_completed",
                             "task_id": task.id,
-                            "duration": (
-                                    datetime.now() - start_time
-                            ).total_seconds()
+                            "duration": time.monotonic() - start_time
                         }
                     ))
 
@@ -450,8 +452,8 @@ class AnalysisEngine:
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"Task worker error: {e}")
+            except Exception:
+                logger.exception("Task worker error")
                 await asyncio.sleep(1.0)
 
     async def _execute_analysis(
@@ -471,7 +473,7 @@ class AnalysisEngine:
         Raises:
             AnalysisTaskError: If analysis fails
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
             # Get and validate analyzer
@@ -500,7 +502,7 @@ class AnalysisEngine:
                 insights=insights,
                 metrics=metrics,
                 confidence=self._calculate_confidence(insights),
-                duration=(datetime.now() - start_time).total_seconds(),
+                duration=time.monotonic() - start_time,
                 timestamp=datetime.now()
             )
 
@@ -14,6 +14,52 @@ from .types import (
 )
 from .registry import BaseAnalyzer, analyzer_registry
 
+# Communication style indicators
+ASSERTIVE_WORDS = frozenset({
+    "definitely", "certainly", "absolutely",
+    "must", "should", "will"
+})
+COLLABORATIVE_WORDS = frozenset({
+    "we", "together", "let's",
+    "agree", "share", "help"
+})
+ANALYTICAL_WORDS = frozenset({
+    "analyze", "consider", "evaluate",
+    "data", "evidence", "logic"
+})
+
+# Decisiveness indicators
+DECISIVE_INDICATORS = frozenset({
+    "decide", "chosen", "selected",
+    "will", "going to", "plan"
+})
+UNCERTAIN_INDICATORS = frozenset({
+    "maybe", "perhaps", "might",
+    "could", "possibly", "not sure"
+})
+
+# Interaction pattern type, strength and phrase indicators
+INTERACTION_INDICATORS = (
+    ("turn_taking", "high", (
+        "you mentioned", "as you said",
+        "to add to that", "building on"
+    )),
+    ("active_discussion", "medium", (
+        "what if", "how about",
+        "another approach", "alternatively"
+    )),
+    ("problem_solving", "high", (
+        "solution", "resolve", "address",
+        "fix", "improve", "optimize"
+    )),
+)
+# One alternation per type, searched separately so that a phrase of one
+# type cannot hide an overlapping phrase of another
+INTERACTION_PATTERNS = tuple(
+    (pattern_type, strength, re.compile("|".join(map(re.escape, indicators))))
+    for pattern_type, strength, indicators in INTERACTION_INDICATORS
+)
+
 
 class EngagementAnalyzer(BaseAnalyzer):
     """Analyzes conversation engagement levels."""
@@ -77,7 +123,7 @@ class EngagementAnalyzer(BaseAnalyzer):
         ))
 
         # Add quantitative metrics
-        metrics = await self._calculate_engagement_metrics(turns)
+        metrics = self._calculate_engagement_metrics(turns)
         insights.append(AnalysisInsight(
             type=AnalysisType.ENGAGEMENT,
             content=metrics,
@@ -88,7 +134,7 @@ class EngagementAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _calculate_engagement_metrics(
+    def _calculate_engagement_metrics(
             self,
             turns: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -132,10 +178,10 @@ class EngagementAnalyzer(BaseAnalyzer):
                 if response_times else 0
             ),
             "turn_distribution": dict(speaker_turns),
-            "engagement_patterns": await self._detect_patterns(turns)
+            "engagement_patterns": self._detect_patterns(turns)
         }
 
-    async def _detect_patterns(
+    def _detect_patterns(
             self,
             turns: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -158,13 +204,13 @@ class EngagementAnalyzer(BaseAnalyzer):
         sequence_length = 3
         for i in range(len(turns) - sequence_length + 1):
             sequence = turns[i:i + sequence_length]
-            pattern = await self._analyze_sequence(sequence)
+            pattern = self._analyze_sequence(sequence)
             if pattern:
                 patterns.append(pattern)
 
         return patterns
 
-    async def _analyze_sequence(
+    def _analyze_sequence(
             self,
             sequence: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
@@ -292,7 +338,7 @@ class BehavioralAnalyzer(BaseAnalyzer):
         ))
 
         # Add behavioral metrics
-        metrics = await self._calculate_behavioral_metrics(text)
+        metrics = self._calculate_behavioral_metrics(text)
         insights.append(AnalysisInsight(
             type=AnalysisType.BEHAVIORAL,
             content=metrics,
@@ -303,7 +349,7 @@ class BehavioralAnalyzer(BaseAnalyzer):
 
         return insights
 
-    async def _calculate_behavioral_metrics(
+    def _calculate_behavioral_metrics(
             self,
             text: str
     ) -> Dict[str, Any]:
@@ -315,21 +361,8 @@ class BehavioralAnalyzer(BaseAnalyzer):
         Returns:
             Behavioral metrics
         """
-        # Communication style indicators
-        assertive_words = {
-            "definitely", "certainly", "absolutely",
-            "must", "should", "will"
-        }
-        collaborative_words = {
-            "we", "together", "let's",
-            "agree", "share", "help"
-        }
-        analytical_words = {
-            "analyze", "consider", "evaluate",
-            "data", "evidence", "logic"
-        }
-
-        words = text.lower().split()
+        lowered = text.lower()
+        words = lowered.split()
 
         # Calculate style scores
         total_words = len(words)
@@ -343,13 +376,13 @@ class BehavioralAnalyzer(BaseAnalyzer):
 
         style_scores = {
             "assertive": sum(
-                1 for w in words if w in assertive_words
+                1 for w in words if w in ASSERTIVE_WORDS
             ) / total_words,
             "collaborative": sum(
-                1 for w in words if w in collaborative_words
+                1 for w in words if w in COLLABORATIVE_WORDS
             ) / total_words,
             "analytical": sum(
-                1 for w in words if w in analytical_words
+                1 for w in words if w in ANALYTICAL_WORDS
             ) / total_words
         }
 
@@ -362,72 +395,45 @@ class BehavioralAnalyzer(BaseAnalyzer):
         return {
             "communication_style": dominant_style,
             "style_scores": style_scores,
-            "interaction_patterns": await self._detect_interaction_patterns(text),
-            "decisiveness": await self._calculate_decisiveness(text)
+            "interaction_patterns": self._detect_interaction_patterns(lowered),
+            "decisiveness": self._calculate_decisiveness(words)
         }
 
-    async def _detect_interaction_patterns(
+    def _detect_interaction_patterns(
             self,
             text: str
     ) -> List[Dict[str, Any]]:
         """Detect interaction patterns.
 
         Args:
-            text: Text to analyze
+            text: Lowercased text to analyze
 
         Returns:
             List of detected patterns
         """
-        patterns = []
-
-        # Check for various interaction patterns
-        if self._has_turn_taking(text):
-            patterns.append({
-                "type": "turn_taking",
-                "strength": "high"
-            })
-
-        if self._has_active_discussion(text):
-            patterns.append({
-                "type": "active_discussion",
-                "strength": "medium"
-            })
-
-        if self._has_problem_solving(text):
-            patterns.append({
-                "type": "problem_solving",
-                "strength": "high"
-            })
+        return [
+            {"type": pattern_type, "strength": strength}
+            for pattern_type, strength, pattern in INTERACTION_PATTERNS
+            if pattern.search(text)
+        ]
 
-        return patterns
-
-    async def _calculate_decisiveness(
+    def _calculate_decisiveness(
             self,
-            text: str
+            words: List[str]
     ) -> float:
         """Calculate decisiveness score.
 
         Args:
-            text: Text to analyze
+            words: Lowercased words of the text
 
         Returns:
             Decisiveness score
         """
-        decisive_indicators = {
-            "decide", "chosen", "selected",
-            "will", "going to", "plan"
-        }
-        uncertain_indicators = {
-            "maybe", "perhaps", "might",
-            "could", "possibly", "not sure"
-        }
-
-        words = text.lower().split()
         decisive_count = sum(
-            1 for w in words if w in decisive_indicators
+            1 for w in words if w in DECISIVE_INDICATORS
         )
         uncertain_count = sum(
-            1 for w in words if w in uncertain_indicators
+            1 for w in words if w in UNCERTAIN_INDICATORS
         )
 
         total = decisive_count + uncertain_count
@@ -436,42 +442,6 @@ class BehavioralAnalyzer(BaseAnalyzer):
 
         return decisive_count / total
 
-    def _has_turn_taking(self, text: str) -> bool:
-        """Check for turn-taking pattern."""
-        # Look for turn indicators
-        turn_indicators = {
-            "you mentioned", "as you said",
-            "to add to that", "building on"
-        }
-        return any(
-            indicator in text.lower()
-            for indicator in turn_indicators
-        )
-
-    def _has_active_discussion(self, text: str) -> bool:
-        """Check for active discussion pattern."""
-        # Look for discussion indicators
-        discussion_indicators = {
-            "what if", "how about",
-            "another approach", "alternatively"
-        }
-        return any(
-            indicator in text.lower()
-            for indicator in discussion_indicators
-        )
-
-    def _has_problem_solving(self, text: str) -> bool:
-        """Check for problem-solving pattern."""
-        # Look for problem-solving indicators
-        problem_solving_indicators = {
-            "solution", "resolve", "address",
-            "fix", "improve", "optimize"
-        }
-        return any(
-            indicator in text.lower()
-            for indicator in problem_solving_indicators
-        )
-
 
 # Register specialized analyzers
 analyzer_registry.register(AnalysisType.ENGAGEMENT, EngagementAnalyzer)
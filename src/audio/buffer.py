@@ -2,8 +2,9 @@
 
 import asyncio
 from collections import deque
+from dataclasses import asdict
 from datetime import datetime
-from typing import AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from src.events.bus import EventBus
 from src.events.types import Event, EventType
@@ -45,6 +46,9 @@ class AudioBuffer:
         # Track buffer sizes
         self._sizes = {k: 0 for k in self._buffers}
 
+        # Signalled whenever data is written to a buffer
+        self._data_written = {k: asyncio.Event() for k in self._buffers}
+
         # Track timestamps
         self._last_write = {k: None for k in self._buffers}
         self._last_read = {k: None for k in self._buffers}
@@ -103,6 +107,9 @@ class AudioBuffer:
                 and self.config.channel_config == ChannelConfig.STEREO
             ):
                 await self._split_stereo_channels(data)
+                self._data_written["ch_0"].set()
+                self._data_written["ch_1"].set()
+            self._data_written[buffer_key].set()
 
             await self._publish_buffer_event("write_complete", len(data))
 
@@ -121,16 +128,16 @@ class AudioBuffer:
         sample_size = 2
         frame_size = sample_size * self.config.channels
 
-        # Split the stereo data
-        for i in range(0, len(data), frame_size):
-            frame = data[i : i + frame_size]
-            if len(frame) == frame_size:
-                # Left channel (first 2 bytes)
-                self._buffers["ch_0"].append(frame[:sample_size])
-                self._sizes["ch_0"] += sample_size
-                # Right channel (second 2 bytes)
-                self._buffers["ch_1"].append(frame[sample_size:])
-                self._sizes["ch_1"] += sample_size
+        # De-interleave whole frames with strided views: one chunk per
+        # channel per write rather than one bytes object per sample
+        usable = len(data) - len(data) % frame_size
+        if not usable:
+            return
+        samples = memoryview(data)[:usable].cast("h")
+        for index, key in enumerate(("ch_0", "ch_1")):
+            channel_data = samples[index :: self.config.channels].tobytes()
+            self._buffers[key].append(channel_data)
+            self._sizes[key] += len(channel_data)
 
     async def read(
         self,
@@ -166,15 +173,9 @@ class AudioBuffer:
             else:
                 read_size = (read_size // 2) * 2
 
-            # Wait for data if timeout specified
+            # Wait for writes if timeout specified
             if timeout and current_size < read_size:
-                start = datetime.now()
-                while (
-                    current_size < read_size
-                    and (datetime.now() - start).total_seconds() < timeout
-                ):
-                    await asyncio.sleep(0.001)
-                    current_size = self._sizes[buffer_key]
+                current_size = await self._wait_for_data(buffer_key, read_size, timeout)
 
             # Check if enough data available
             if current_size < read_size:
@@ -182,22 +183,24 @@ class AudioBuffer:
                 return None
 
             # Combine data from buffer
-            data = bytes()
+            parts = []
             remaining = read_size
 
             while remaining > 0 and buffer:
                 chunk = buffer.popleft()
                 if len(chunk) <= remaining:
-                    data += chunk
+                    parts.append(chunk)
                     remaining -= len(chunk)
                     self._sizes[buffer_key] -= len(chunk)
                 else:
                     # Split chunk if needed
-                    data += chunk[:remaining]
+                    parts.append(chunk[:remaining])
                     buffer.appendleft(chunk[remaining:])
                     self._sizes[buffer_key] -= remaining
                     remaining = 0
 
+            data = b"".join(parts)
+
             self._last_read[buffer_key] = datetime.now()
             self._metrics.total_bytes_read += len(data)
 
@@ -209,6 +212,38 @@ class AudioBuffer:
         except Exception as e:
             raise BufferError(f"Read failed: {str(e)}")
 
+    async def _wait_for_data(
+        self,
+        buffer_key: str,
+        read_size: int,
+        timeout: float,
+    ) -> int:
+        """Wait until a buffer holds enough data or the timeout expires.
+
+        Args:
+            buffer_key: Buffer to wait on
+            read_size: Number of bytes wanted
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Buffer size when the wait ended
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        data_written = self._data_written[buffer_key]
+        current_size = self._sizes[buffer_key]
+        while current_size < read_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            data_written.clear()
+            try:
+                await asyncio.wait_for(data_written.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            current_size = self._sizes[buffer_key]
+        return current_size
+
     async def read_stream(self, channel: Optional[str] = None) -> AsyncIterator[bytes]:
         """Stream audio data from buffer.
 
@@ -218,12 +253,15 @@ class AudioBuffer:
         Yields:
             Audio chunks
         """
+        data_written = self._data_written.get(channel or "combined")
         while True:
             chunk = await self.read(channel=channel)
             if chunk:
                 yield chunk
             else:
-                await asyncio.sleep(0.001)
+                # Sleep until the next write instead of polling
+                data_written.clear()
+                await data_written.wait()
 
     def get_status(self) -> BufferStatus:
         """Get current buffer status.
@@ -238,6 +276,22 @@ class AudioBuffer:
             metrics=self._metrics,
         )
 
+    def _status_dict(self) -> Dict[str, Any]:
+        """Build the serialized buffer status for events.
+
+        Same shape as ``get_status().model_dump()`` without constructing
+        and validating a BufferStatus on every read and write.
+
+        Returns:
+            Buffer status dictionary
+        """
+        return {
+            "levels": {k: (v / self.max_size) * 100 for k, v in self._sizes.items()},
+            "latencies": {k: self._calculate_latency(k) for k in self._buffers},
+            "active_channels": {k for k, v in self._sizes.items() if v > 0},
+            "metrics": asdict(self._metrics),
+        }
+
     def _calculate_latency(self, channel: str) -> float:
         """Calculate buffer latency in milliseconds.
 
@@ -264,7 +318,7 @@ class AudioBuffer:
                 data={
                     "status": status,
                     "bytes_processed": bytes_processed,
-                    "buffer_status": self.get_status().model_dump(),
+                    "buffer_status": self._status_dict(),
                 },
             )
         )
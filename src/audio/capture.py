@@ -1,5 +1,7 @@
 """Audio capture and stream management."""
 
+import logging
+import time
 from datetime import datetime
 from typing import Any, AsyncIterator, Dict, Optional
 
@@ -13,6 +15,11 @@ from .mixer import AudioMixer
 from .processor import AudioProcessor
 from .types import AudioConfig, DeviceInfo, ProcessingResult
 
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between logged per-chunk errors
+ERROR_LOG_INTERVAL = 5.0
+
 
 class AudioCapture:
     """Manages audio capture and processing pipeline."""
@@ -44,6 +51,8 @@ class AudioCapture:
             "start_time": None,
             "last_chunk": None,
         }
+        self._last_error_log = float("-inf")
+        self._suppressed_errors = 0
 
     async def start_capture(self) -> None:
         """Start audio capture."""
@@ -105,7 +114,7 @@ class AudioCapture:
                 self.desktop_device, self.config
             )
 
-            print("Processing loop started.")
+            logger.info("Processing loop started")
 
             async for mic_chunk, desktop_chunk in self._read_chunks(
                 mic_stream, desktop_stream
@@ -132,7 +141,7 @@ class AudioCapture:
                     )
 
                 except Exception as e:
-                    print(f"Error processing chunk: {e}")
+                    self._log_chunk_error("Error processing chunk", e)
                     await self._publish_capture_event(
                         "capture_error", {"error": str(e)}
                     )
@@ -140,7 +149,7 @@ class AudioCapture:
                         break
 
         except Exception as e:
-            print(f"Error in processing loop: {e}")
+            logger.exception("Error in processing loop")
             await self._publish_capture_event("capture_error", {"error": str(e)})
 
     async def _read_chunks(
@@ -153,20 +162,40 @@ class AudioCapture:
                 desktop_chunk = await anext(desktop_stream)
 
                 if mic_chunk is None or desktop_chunk is None:
-                    print("One of the streams ended. Breaking the loop.")
+                    logger.info("One of the streams ended, stopping capture loop")
                     break
 
                 yield mic_chunk, desktop_chunk
 
             except StopAsyncIteration:
-                print("Stream iteration completed.")
+                logger.info("Stream iteration completed")
                 break
             except Exception as e:
-                print(f"Error reading chunk: {e}")
+                self._log_chunk_error("Error reading chunk", e)
                 await self._publish_capture_event("capture_error", {"error": str(e)})
                 if not self._running:
                     break
 
+    def _log_chunk_error(self, message: str, error: Exception) -> None:
+        """Log a per-chunk error, at most once per ERROR_LOG_INTERVAL.
+
+        Args:
+            message: Log message
+            error: Exception raised while handling the chunk
+        """
+        now = time.monotonic()
+        if now - self._last_error_log < ERROR_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            return
+        logger.error(
+            "%s (%d similar errors suppressed)",
+            message,
+            self._suppressed_errors,
+            exc_info=error,
+        )
+        self._last_error_log = now
+        self._suppressed_errors = 0
+
     async def _update_stats(self, result: ProcessingResult) -> None:
         """Update capture statistics."""
         self._stats["bytes_processed"] += len(result.processed_data)
@@ -1,6 +1,7 @@
 """Enhanced Device Manager with pyaudiowpatch support."""
 
 import asyncio
+import logging
 from typing import AsyncIterator, Dict, List, Optional
 
 import pyaudiowpatch as pyaudio
@@ -8,6 +9,8 @@ import pyaudiowpatch as pyaudio
 from .exceptions import DeviceError
 from .types import AudioConfig, DeviceInfo, DeviceType
 
+logger = logging.getLogger(__name__)
+
 
 class DeviceManager:
     """Manages audio device discovery, validation, and streaming with pyaudiowpatch."""
@@ -41,7 +44,7 @@ class DeviceManager:
         try:
             devices = []
             with pyaudio.PyAudio() as audio_manager:
-                print("Debug: PyAudio instance created")
+                logger.debug("PyAudio instance created")
                 for info in audio_manager.get_device_info_generator():
                     if info:
                         devices.append(self._parse_device_info(info))
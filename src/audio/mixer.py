@@ -106,12 +106,13 @@ class AudioMixer:
         Returns:
             AudioMetrics: Calculated audio metrics.
         """
+        magnitude = np.abs(audio_data)
         return AudioMetrics(
-            peak_level=float(np.max(np.abs(audio_data))),
-            rms_level=float(np.sqrt(np.mean(audio_data**2))),
-            noise_level=float(np.percentile(np.abs(audio_data), 10)),
-            clipping_count=int(np.sum(np.abs(audio_data) > 0.99)),
-            dropout_count=int(np.sum(np.abs(audio_data) < 0.01)),
+            peak_level=float(magnitude.max()),
+            rms_level=float(np.sqrt(np.vdot(audio_data, audio_data) / audio_data.size)),
+            noise_level=float(np.percentile(magnitude, 10)),
+            clipping_count=int(np.count_nonzero(magnitude > 0.99)),
+            dropout_count=int(np.count_nonzero(magnitude < 0.01)),
             processing_time=0.0,  # Populated during processing
             buffer_stats={},  # Placeholder for additional stats
         )
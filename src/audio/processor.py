@@ -61,7 +61,7 @@ class AudioProcessor:
             ProcessingError: If processing fails
         """
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Convert to float array
             float_data = self._to_float_array(audio_data)
@@ -83,7 +83,9 @@ class AudioProcessor:
                 processed = await self._apply_gain(processed)
 
             # Calculate metrics
-            metrics = self._calculate_metrics(processed, time.time() - start_time)
+            metrics = self._calculate_metrics(
+                processed, time.perf_counter() - start_time
+            )
 
             # Convert back to bytes
             processed_bytes = (processed * 32767).astype(np.int16).tobytes()
@@ -207,12 +209,13 @@ class AudioProcessor:
         Returns:
             Audio metrics
         """
+        magnitude = np.abs(audio_data)
         return AudioMetrics(
-            peak_level=float(np.max(np.abs(audio_data))),
-            rms_level=float(np.sqrt(np.mean(audio_data**2))),
+            peak_level=float(magnitude.max()),
+            rms_level=float(np.sqrt(np.vdot(audio_data, audio_data) / audio_data.size)),
             noise_level=float(self.noise_profile if self._calibrated else 0.0),
-            clipping_count=int(np.sum(np.abs(audio_data) > 0.99)),
-            dropout_count=int(np.sum(np.abs(audio_data) < 0.01)),
+            clipping_count=int(np.count_nonzero(magnitude > 0.99)),
+            dropout_count=int(np.count_nonzero(magnitude < 0.01)),
             processing_time=processing_time,
             buffer_stats={"running_max": float(self._running_max)},
         )
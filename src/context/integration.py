@@ -2,6 +2,7 @@
 from typing import Dict, List, Any, Optional, AsyncIterator
 from datetime import datetime
 import asyncio
+import logging
 
 from src.conversation.manager import ConversationManager
 from src.document.processor import DocumentProcessor
@@ -22,6 +23,8 @@ from .exceptions import (
     ContextUpdateError
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ContextIntegration:
     """Handles real-time context integration."""
@@ -230,8 +233,8 @@ class ContextIntegration:
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"Update loop error: {e}")
+            except Exception:
+                logger.exception("Update loop error")
                 await asyncio.sleep(1.0)
 
     async def _process_session_updates(
@@ -2,6 +2,7 @@
 from typing import Dict, Any, List, Optional, Set, AsyncIterator
 from datetime import datetime, timedelta
 import asyncio
+import logging
 import uuid
 
 from src.events.bus import EventBus
@@ -28,6 +29,8 @@ from .exceptions import (
     ContextQueryError
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ContextManager:
     """Manages context storage, retrieval, and updates."""
@@ -502,8 +505,8 @@ class ContextManager:
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"Cleanup error: {e}")
+            except Exception:
+                logger.exception("Cleanup error")
                 await asyncio.sleep(60)
 
     def _setup_event_handlers(self) -> None:
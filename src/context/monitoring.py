@@ -3,6 +3,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from collections import defaultdict
 import asyncio
+import logging
 import time
 
 from src.events.bus import EventBus
@@ -16,6 +17,9 @@ from .types import (
     ContextConfig
 )
 from .exceptions import ContextError
+from .utils import RunningStats
+
+logger = logging.getLogger(__name__)
 
 
 class ContextMetrics:
@@ -28,7 +32,7 @@ class ContextMetrics:
     def reset_metrics(self) -> None:
         """Reset all metrics."""
         self.operation_counts = defaultdict(int)
-        self.operation_times = defaultdict(list)
+        self.operation_times: Dict[str, RunningStats] = defaultdict(RunningStats)
         self.source_counts = defaultdict(int)
         self.priority_counts = defaultdict(int)
         self.state_counts = defaultdict(int)
@@ -53,7 +57,7 @@ class ContextMetrics:
         """
         # Update general metrics
         self.operation_counts[operation] += 1
-        self.operation_times[operation].append(duration)
+        self.operation_times[operation].add(duration)
         self.source_counts[metadata.source] += 1
         self.priority_counts[metadata.priority] += 1
         self.state_counts[metadata.state] += 1
@@ -105,8 +109,12 @@ class ContextMetrics:
             "operations": {
                 "counts": dict(self.operation_counts),
                 "average_times": {
-                    op: sum(times) / len(times) if times else 0
-                    for op, times in self.operation_times.items()
+                    op: stats.mean
+                    for op, stats in self.operation_times.items()
+                },
+                "time_variances": {
+                    op: stats.variance
+                    for op, stats in self.operation_times.items()
                 }
             },
             "sources": dict(self.source_counts),
@@ -205,7 +213,7 @@ class ContextMonitor:
         """
         self._operations[operation_id] = {
             "type": operation_type,
-            "start_time": time.time(),
+            "start_time": time.monotonic(),
             "metadata": metadata,
             "completed": False
         }
@@ -225,7 +233,7 @@ class ContextMonitor:
         """
         if operation_id in self._operations:
             operation = self._operations[operation_id]
-            duration = time.time() - operation["start_time"]
+            duration = time.monotonic() - operation["start_time"]
 
             # Track metrics
             await self.metrics.track_operation(
@@ -253,7 +261,7 @@ class ContextMonitor:
             Active operations
         """
         active = {}
-        current_time = time.time()
+        current_time = time.monotonic()
 
         for op_id, operation in self._operations.items():
             if not operation["completed"]:
@@ -309,13 +317,13 @@ class ContextMonitor:
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"Monitor loop error: {e}")
+            except Exception:
+                logger.exception("Monitor loop error")
                 await asyncio.sleep(1.0)
 
     async def _check_stalled_operations(self) -> None:
         """Check for stalled operations."""
-        current_time = time.time()
+        current_time = time.monotonic()
         stalled_threshold = 60.0  # 1 minute
 
         for op_id, operation in self._operations.items():
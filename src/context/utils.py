@@ -13,6 +13,34 @@ from .types import (
 )
 
 
+class RunningStats:
+    """Running mean and variance using Welford's algorithm."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample.
+
+        Args:
+            value: Sample value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0.0 with fewer than two samples."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
 class ContextMerger:
     """Handles merging of context entries."""
 
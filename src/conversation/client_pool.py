@@ -2,8 +2,56 @@
 
 from typing import Dict, Any, Optional, AsyncIterator
 import asyncio
-import aioboto3
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from types import TracebackType
+
+try:
+    import aioboto3
+except ImportError:  # Fall back to boto3 driven from a thread pool
+    aioboto3 = None
+    import boto3
+
+
+class ThreadedBedrockClient:
+    """Async adapter running a blocking boto3 client in a thread pool."""
+
+    def __init__(self, client: Any, executor: ThreadPoolExecutor):
+        """Initialize adapter.
+
+        Args:
+            client: boto3 bedrock-runtime client
+            executor: Executor the blocking calls run on
+        """
+        self._client = client
+        self._executor = executor
+
+    async def converse_stream(self, **kwargs: Any) -> Dict[str, Any]:
+        """Start a Converse stream without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executor, lambda: self._client.converse_stream(**kwargs)
+        )
+        return {**response, "stream": self._iter_stream(response["stream"])}
+
+    async def _iter_stream(self, stream: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Read stream events, one blocking read per executor hop."""
+        loop = asyncio.get_running_loop()
+        events = iter(stream)
+        while True:
+            event = await loop.run_in_executor(self._executor, next, events, None)
+            if event is None:
+                break
+            yield event
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the underlying client."""
+        self._client.close()
 
 
 class BedrockClientPool:
@@ -14,11 +62,12 @@ class BedrockClientPool:
 
         Args:
             region: AWS region
-            pool_size: Number of clients in pool
+            pool_size: Number of worker threads when falling back to boto3
         """
         self.region = region
         self.pool_size = pool_size
-        self.session = aioboto3.Session()
+        self.session = aioboto3.Session() if aioboto3 else boto3.Session()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._clients: Dict[str, Any] = {}
         self._locks: Dict[str, asyncio.Lock] = {}
 
@@ -34,9 +83,20 @@ class BedrockClientPool:
 
         for client_type in client_types:
             # Create client
-            client = await self.session.client(
-                "bedrock-runtime", region_name=self.region
-            ).__aenter__()
+            if aioboto3 is not None:
+                client = await self.session.client(
+                    "bedrock-runtime", region_name=self.region
+                ).__aenter__()
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_size,
+                        thread_name_prefix="bedrock",
+                    )
+                client = ThreadedBedrockClient(
+                    self.session.client("bedrock-runtime", region_name=self.region),
+                    self._executor,
+                )
 
             # Store client and its lock
             self._clients[client_type] = client
@@ -50,6 +110,9 @@ class BedrockClientPool:
             await client.__aexit__(exc_type, exc_val, exc_tb)
         self._clients.clear()
         self._locks.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     @asynccontextmanager
     async def get_client(self, client_type: str):
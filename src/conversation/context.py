@@ -44,6 +44,9 @@ class ConversationContext:
 
         # Conversation state
         self.turns: List[Message] = []
+        # Rendered "role: text" line per turn, and the joined transcript
+        self._transcript_lines: List[str] = []
+        self._transcript: Optional[str] = None
         self.tool_states: Dict[str, Dict[str, Any]] = {}
         self.active_tools: Set[str] = set()
         self.context_references: Dict[str, Set[str]] = {}
@@ -71,6 +74,11 @@ class ConversationContext:
 
         # Add to turns
         self.turns.append(message)
+        self._transcript_lines.append(
+            f"{message.role}: "
+            + " ".join(content.text for content in message.content if content.text)
+        )
+        self._transcript = None
 
         # Emit message event
         await self.event_bus.publish(Event(
@@ -293,6 +301,19 @@ class ConversationContext:
         # Clear active tools
         self.active_tools.clear()
 
+    def get_transcript(self) -> str:
+        """Get the conversation as one "role: text" line per turn.
+
+        Lines are rendered as turns are added and the joined text is
+        reused until the next turn.
+
+        Returns:
+            Conversation transcript
+        """
+        if self._transcript is None:
+            self._transcript = "\n".join(self._transcript_lines)
+        return self._transcript
+
     def get_last_turn(
         self,
         role: Optional[MessageRole] = None
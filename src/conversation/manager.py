@@ -1,6 +1,7 @@
 """Conversation manager with client pool and context handling."""
 
 import asyncio
+import logging
 from typing import Dict, List, Optional, AsyncIterator
 
 from src.events.bus import EventBus
@@ -16,6 +17,8 @@ from .types import (
 )
 from .client_pool import BedrockClientPool
 
+logger = logging.getLogger(__name__)
+
 
 class ConversationManager:
     """Manages conversations with parallel processing."""
@@ -70,19 +73,21 @@ class ConversationManager:
             if client_type:
                 if client_type == "pre_processing":
                     async with self.client_pool.get_client("pre_processing") as client:
-                        response = ""
-                        async for event in client.invoke_model_with_response_stream(
-                            **message.model_dump()
-                        ):
+                        parts = []
+                        stream = await client.converse_stream(**message.model_dump())
+                        async for event in stream["stream"]:
                             try:
                                 if "contentBlockDelta" in event:
                                     delta = event["contentBlockDelta"]["delta"]
-                                    response += delta.get("text")
-                                    yield response
+                                    response = delta.get("text")
+                                    if response:
+                                        parts.append(response)
+                                        yield response
                                 if "messageStop" in event:
-                                    print(response)
-                                    response_text = response  # We might need to
-                                    # append the last delta
+                                    response_text = "".join(parts)
+                                    logger.debug(
+                                        "Pre-processing response: %s", response_text
+                                    )
 
                             except Exception as e:
                                 yield StreamError(
@@ -168,13 +173,12 @@ class ConversationManager:
                             *tasks.values(), return_exceptions=True
                         )
                         # TODO: Add return statement
-                        print(results)
+                        logger.debug("Post-processing results: %s", results)
 
                 if client_type == "response":
                     async with self.client_pool.get_client("response") as client:
-                        async for event in client.converse_stream(
-                            **message.model_dump()
-                        ):
+                        stream = await client.converse_stream(**message.model_dump())
+                        async for event in stream["stream"]:
                             try:
                                 if "contentBlockDelta" in event:
                                     delta = event["contentBlockDelta"]["delta"]
@@ -193,9 +197,8 @@ class ConversationManager:
 
                 if client_type == "sentiment":
                     async with self.client_pool.get_client("sentiment") as client:
-                        async for event in client.converse_stream(
-                            **message.model_dump()
-                        ):
+                        stream = await client.converse_stream(**message.model_dump())
+                        async for event in stream["stream"]:
                             try:
                                 if "contentBlockDelta" in event:
                                     delta = event["contentBlockDelta"]["delta"]
@@ -214,9 +217,8 @@ class ConversationManager:
 
                 if client_type == "feedback":
                     async with self.client_pool.get_client("feedback") as client:
-                        async for event in client.converse_stream(
-                            **message.model_dump()
-                        ):
+                        stream = await client.converse_stream(**message.model_dump())
+                        async for event in stream["stream"]:
                             try:
                                 if "contentBlockDelta" in event:
                                     delta = event["contentBlockDelta"]["delta"]
@@ -1,6 +1,7 @@
 """Role-specific behavior and configuration."""
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional
 from dataclasses import dataclass, field
+from string import Formatter
 
 from .types import (
     Role,
@@ -39,6 +40,7 @@ class RoleManager:
         self.role_prompts = self._initialize_prompts()
         self.role_configs = self._initialize_configs()
         self.tool_configs = self._initialize_tools()
+        self._template_fields: Dict[str, FrozenSet[str]] = {}
 
     def get_system_prompts(
         self,
@@ -70,18 +72,17 @@ class RoleManager:
         if context:
             for context_type, prompt_template in role_prompts.context_prompts.items():
                 if context_type in context:
-                    try:
-                        prompt_text = prompt_template.format(**context)
-                        prompts.append(SystemPrompt(
-                            text=prompt_text,
-                            metadata={
-                                "type": "context_prompt",
-                                "context_type": context_type
-                            },
-                            priority=2
-                        ))
-                    except KeyError:
+                    # Skip prompts whose variables are not all provided
+                    if not self._get_template_fields(prompt_template) <= context.keys():
                         continue
+                    prompts.append(SystemPrompt(
+                        text=prompt_template.format_map(context),
+                        metadata={
+                            "type": "context_prompt",
+                            "context_type": context_type
+                        },
+                        priority=2
+                    ))
 
         # Add tool-specific prompts
         config = self.role_configs.get(role)
@@ -100,6 +101,24 @@ class RoleManager:
 
         return sorted(prompts, key=lambda x: x.priority, reverse=True)
 
+    def _get_template_fields(self, template: str) -> FrozenSet[str]:
+        """Get the variable names a prompt template refers to.
+
+        Args:
+            template: Prompt template
+
+        Returns:
+            Top-level field names used by the template
+        """
+        fields = self._template_fields.get(template)
+        if fields is None:
+            fields = self._template_fields[template] = frozenset(
+                name.partition(".")[0].partition("[")[0]
+                for _, name, _, _ in Formatter().parse(template)
+                if name is not None
+            )
+        return fields
+
     def get_tools(
         self,
         role: Role
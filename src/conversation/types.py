@@ -4,7 +4,13 @@ from enum import Enum
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DeferredModel(BaseModel):
+    """Base model that builds its validation schema on first use."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class Role(str, Enum):
@@ -64,49 +70,49 @@ class ResponseType(str, Enum):
     DISCUSSION_POINTS = "discussion_points"  # For meeting contributions
 
 
-class Source(BaseModel):
+class Source(DeferredModel):
     bytes: Optional[bytes]
 
 
-class Image(BaseModel):
+class Image(DeferredModel):
     format: str
 
 
-class Document(BaseModel):
+class Document(DeferredModel):
     format: str
     name: str
     source: Source
 
 
-class ToolUse(BaseModel):
+class ToolUse(DeferredModel):
     toolUseId: str
     name: str
     input: Union[dict, list, int, float, str, bool, None]
 
 
-class ToolResultContent(BaseModel):
+class ToolResultContent(DeferredModel):
     json: Optional[Union[dict, list, int, float, str, bool, None]] = None
     text: Optional[str] = None
     image: Optional[Image] = None
     document: Optional[Document] = None
 
 
-class ToolResult(BaseModel):
+class ToolResult(DeferredModel):
     toolUseId: str
     content: List[ToolResultContent]
     status: str
 
 
-class GuardContentText(BaseModel):
+class GuardContentText(DeferredModel):
     text: str
     qualifiers: Optional[List[str]] = None
 
 
-class GuardContent(BaseModel):
+class GuardContent(DeferredModel):
     text: Optional[GuardContentText] = None
 
 
-class ContentBlock(BaseModel):
+class ContentBlock(DeferredModel):
     text: Optional[str] = None
     image: Optional[Image] = None
     document: Optional[Document] = None
@@ -115,52 +121,52 @@ class ContentBlock(BaseModel):
     guardContent: Optional[GuardContent] = None
 
 
-class Message(BaseModel):
+class Message(DeferredModel):
     role: str
     content: List[ContentBlock]
 
 
-class SystemContent(BaseModel):
+class SystemContent(DeferredModel):
     text: Optional[str] = None
     guardContent: Optional[GuardContent] = None
 
 
-class InferenceConfig(BaseModel):
+class InferenceConfig(DeferredModel):
     maxTokens: Optional[int] = None
     temperature: Optional[float] = None
     topP: Optional[float] = None
     stopSequences: Optional[List[str]] = None
 
 
-class ToolSpec(BaseModel):
+class ToolSpec(DeferredModel):
     name: str
     description: Optional[str] = None
     inputSchema: Union[dict, list, int, float, str, bool, None]
 
 
-class ToolChoice(BaseModel):
+class ToolChoice(DeferredModel):
     auto: Optional[dict] = None
     any: Optional[dict] = None
     tool: Optional[Dict[str, str]] = None
 
 
-class ToolConfig(BaseModel):
+class ToolConfig(DeferredModel):
     tools: List[ToolSpec]
     toolChoice: ToolChoice
 
 
-class GuardrailConfig(BaseModel):
+class GuardrailConfig(DeferredModel):
     guardrailIdentifier: str
     guardrailVersion: str
     trace: Optional[str] = None
     streamProcessingMode: Optional[str] = None
 
 
-class PromptVariable(BaseModel):
+class PromptVariable(DeferredModel):
     text: str
 
 
-class Request(BaseModel):
+class Request(DeferredModel):
     messages: List[Message]
     system: Optional[List[SystemContent]] = None
     modelId: Optional[str] = None
@@ -172,7 +178,7 @@ class Request(BaseModel):
     additionalModelResponseFieldPaths: Optional[List[str]] = None
 
 
-class ConversationState(BaseModel):
+class ConversationState(DeferredModel):
     """Current state of a conversation."""
 
     session_id: str
@@ -183,7 +189,7 @@ class ConversationState(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Usage(BaseModel):
+class Usage(DeferredModel):
     """Usage metrics for a conversation."""
 
     inputTokens: int
@@ -191,13 +197,13 @@ class Usage(BaseModel):
     totalTokens: int
 
 
-class Metrics(BaseModel):
+class Metrics(DeferredModel):
     """Metrics for a conversation."""
 
     latencyMs: int
 
 
-class Metadata(BaseModel):
+class Metadata(DeferredModel):
     """Metadata for a conversation."""
 
     usage: Usage
@@ -205,7 +211,7 @@ class Metadata(BaseModel):
     trace: Dict[str, Any]
 
 
-class ResponseConfig(BaseModel):
+class ResponseConfig(DeferredModel):
     """Configuration for response generation."""
 
     response_types: List[ResponseType]
@@ -216,7 +222,7 @@ class ResponseConfig(BaseModel):
     temperature: float = 0.7
 
 
-class GeneratedResponse(BaseModel):
+class GeneratedResponse(DeferredModel):
     """A generated response."""
 
     text: str
@@ -227,7 +233,7 @@ class GeneratedResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class ConversationMetrics(BaseModel):
+class ConversationMetrics(DeferredModel):
     """Metrics for conversation tracking."""
 
     total_messages: int = 0
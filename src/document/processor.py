@@ -1,8 +1,16 @@
 """Document processor using direct messaging with role-based formats."""
 
-import json
-from typing import Dict, Any, AsyncIterator
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
+from string import Template
+import hashlib
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib API is compatible here
+    import json as orjson
 
 from src.conversation.manager import ConversationManager
 from src.context.manager import ContextManager
@@ -13,12 +21,37 @@ from src.conversation.types import (
     Request,
     ContentBlock,
     Source,
-    Document,
+    Document as DocumentBlock,
     SystemContent,
 )
 
-from .types import Document, ProcessingContext, ProcessingResult
-from .roles import DocumentRoles
+from .types import (
+    Document,
+    DocumentFormat,
+    DocumentType,
+    ProcessingContext,
+    ProcessingResult,
+)
+from .roles import get_role_config
+from .exceptions import AIProcessingError
+
+# Instructions appended to every role's system prompt
+SYSTEM_PROMPT_TEMPLATE = Template(
+    "$prompt Provide your analysis in exactly this JSON format: $format "
+    "Return only valid JSON without any additional text."
+)
+
+# Context update key and analysis field extracted per document type
+CONTEXT_EXTRACTS = {
+    DocumentType.CV: (
+        ("skills", "technical_skills"),
+        ("experience", "experience"),
+    ),
+    DocumentType.JOB_DESCRIPTION: (
+        ("requirements", "key_requirements"),
+        ("responsibilities", "responsibilities"),
+    ),
+}
 
 
 class DocumentProcessor:
@@ -29,11 +62,26 @@ class DocumentProcessor:
         conversation_manager: ConversationManager,
         context_manager: ContextManager,
         event_bus: EventBus,
+        cache_size: int = 128,
     ):
+        """Initialize processor.
+
+        Args:
+            conversation_manager: Conversation manager used for analysis
+            context_manager: Context manager
+            event_bus: Event bus for processing events
+            cache_size: Maximum number of cached processing results
+        """
         self.conversation = conversation_manager
         self.context = context_manager
         self.event_bus = event_bus
-        self.doc_roles = DocumentRoles()
+        self._system_prompts: Dict[
+            Tuple[str, DocumentType], Tuple[SystemContent, str]
+        ] = {}
+        self.cache_size = cache_size
+        self._results: OrderedDict[
+            Tuple[bytes, DocumentFormat, DocumentType, str], ProcessingResult
+        ] = OrderedDict()
 
     async def process_document(
         self,
@@ -47,66 +95,35 @@ class DocumentProcessor:
             context: Processing context
         """
         try:
-            # Get role-specific format and prompt
-            role_config = self.doc_roles.get_role_config(context.role)
-            response_format = role_config.response_format.get(document.doc_type, "{}")
-            system_prompt = role_config.system_prompts.get(document.doc_type)
-
-            request = Request(
-                messages=[
-                    Message(
-                        role="user",
-                        content=[
-                            ContentBlock(
-                                text=f"Analyze this {document.doc_type.value}",
-                                document=Document(
-                                    format=document.format.value,
-                                    name=document.name,
-                                    source=Source(
-                                        bytes=document.content,
-                                    ),
-                                ),
-                            )
-                        ],
-                    )
-                ],
-                system=[
-                    SystemContent(
-                        text=(
-                            f"{system_prompt} "
-                            f"Provide your analysis in exactly this JSON format: "
-                            f"{response_format} "
-                            f"Return only valid JSON without any additional text."
-                        )
-                    )
-                ],
-            )
-
-            # Process through conversation
-            start_time = datetime.now()
-            content = ""
-            async for response in self.conversation.send_message(
-                message=request,
-                client_type="pre_processing",
-            ):
-                if isinstance(response, str):
-                    # Create result
-                    content += response
-
-            result = ProcessingResult(
-                document_id=document.name,
-                content_type=document.doc_type.value,
-                analysis=content,  # Will be JSON from role format
-                processing_time=(datetime.now() - start_time).total_seconds(),
-                context_updates=self._create_context_updates(
-                    content, document.doc_type, context.role
-                ),
-                role_specific={
-                    "role": context.role,
-                    "format_used": response_format,
-                },
-                extracted_at=datetime.now(),
+            start_time = time.perf_counter()
+            cache_key = (
+                hashlib.blake2b(document.content, digest_size=16).digest(),
+                document.format,
+                document.doc_type,
+                context.role,
             )
+            result = self._results.get(cache_key)
+            if result is not None:
+                # Same content already analyzed for this role; the analysis
+                # is reused but timing and timestamps describe this request
+                self._results.move_to_end(cache_key)
+                now = datetime.now()
+                result = result.model_copy(
+                    update={
+                        "document_id": document.name,
+                        "processing_time": time.perf_counter() - start_time,
+                        "context_updates": {
+                            **result.context_updates,
+                            "timestamp": now.isoformat(),
+                        },
+                        "extracted_at": now,
+                    }
+                )
+            else:
+                result = await self._analyze_document(document, context)
+                self._results[cache_key] = result
+                if len(self._results) > self.cache_size:
+                    self._results.popitem(last=False)
 
             # Emit event
             await self.event_bus.publish(
@@ -115,7 +132,7 @@ class DocumentProcessor:
                     data={
                         "status": "processing_complete",
                         "document_id": document.name,
-                        "result": result.model_dump(),
+                        "result": result.as_event_dict(),
                     },
                 )
             )
@@ -135,38 +152,165 @@ class DocumentProcessor:
             )
             raise
 
+    async def _analyze_document(
+        self,
+        document: Document,
+        context: ProcessingContext,
+    ) -> ProcessingResult:
+        """Send the document to the model and build the processing result.
+
+        Args:
+            document: Document to process
+            context: Processing context
+        """
+        # Get role-specific format and prompt
+        system_prompt, response_format = self._get_system_prompt(
+            context.role, document.doc_type
+        )
+
+        request = Request(
+            messages=[
+                Message(
+                    role="user",
+                    # Fields come from a validated Document, so skip
+                    # revalidating the (possibly large) content bytes
+                    content=[
+                        ContentBlock.model_construct(
+                            text=f"Analyze this {document.doc_type.value}",
+                            document=DocumentBlock.model_construct(
+                                format=document.format.value,
+                                name=document.name,
+                                source=Source.model_construct(
+                                    bytes=document.content,
+                                ),
+                            ),
+                        )
+                    ],
+                )
+            ],
+            system=[system_prompt],
+        )
+
+        # Process through conversation
+        start_time = time.perf_counter()
+        parts = []
+        async for response in self.conversation.send_message(
+            message=request,
+            client_type="pre_processing",
+        ):
+            if isinstance(response, str):
+                parts.append(response)
+        content = "".join(parts)
+
+        # Parse once; the dict is shared by the result and context updates
+        parsed = self._parse_analysis(content)
+
+        result = ProcessingResult(
+            document_id=document.name,
+            content_type=document.doc_type.value,
+            analysis=parsed if parsed is not None else {"raw_analysis": content},
+            processing_time=time.perf_counter() - start_time,
+            context_updates=self._create_context_updates(
+                content, parsed, document.doc_type, context.role
+            ),
+            role_specific={
+                "role": context.role,
+                "format_used": response_format,
+            },
+            extracted_at=datetime.now(),
+        )
+
+        return result
+
+    def _get_system_prompt(
+        self, role: str, doc_type: DocumentType
+    ) -> Tuple[SystemContent, str]:
+        """Get the system prompt and response format for a role and type.
+
+        Both only depend on the role configuration, so they are built once
+        per (role, doc_type) and the same SystemContent block is reused for
+        every document.
+
+        Args:
+            role: Role the document is processed for
+            doc_type: Type of the document
+
+        Returns:
+            System prompt block and the expected response format
+        """
+        key = (role, doc_type)
+        cached = self._system_prompts.get(key)
+        if cached is None:
+            role_config = get_role_config(role)
+            response_format = role_config.response_format_text.get(doc_type, "{}")
+            system_prompt = role_config.system_prompts.get(doc_type)
+            cached = self._system_prompts[key] = (
+                SystemContent(
+                    text=SYSTEM_PROMPT_TEMPLATE.substitute(
+                        prompt=system_prompt, format=response_format
+                    )
+                ),
+                response_format,
+            )
+        return cached
+
     @staticmethod
-    def _create_context_updates(
-        analysis: str, doc_type: str, role: str
-    ) -> Dict[str, Any]:
-        """Create context updates from analysis."""
-        try:
-            # Parse the JSON response
-            parsed = json.loads(analysis)
+    def _parse_analysis(content: str) -> Optional[Dict[str, Any]]:
+        """Parse the JSON analysis returned by the model.
 
-            # Create context updates based on document type and role
-            updates = {
-                "document_type": doc_type,
-                "role": role,
-                "timestamp": datetime.now().isoformat(),
-                "analysis": parsed,  # Full analysis
-            }
+        Args:
+            content: Raw model output
 
-            # Add type-specific extracts
-            if doc_type == "cv":
-                updates["skills"] = parsed.get("technical_skills", [])
-                updates["experience"] = parsed.get("experience", [])
-            elif doc_type == "job_description":
-                updates["requirements"] = parsed.get("key_requirements", [])
-                updates["responsibilities"] = parsed.get("responsibilities", [])
+        Returns:
+            Parsed analysis, or None if the output is not valid JSON
 
-            return updates
+        Raises:
+            AIProcessingError: If the output is JSON but not an object
+        """
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return None
+
+        if not isinstance(parsed, dict):
+            raise AIProcessingError(
+                "Analysis is not a JSON object",
+                details={"type": type(parsed).__name__},
+            )
+        return parsed
 
-        except json.JSONDecodeError:
-            # If JSON parsing fails, store raw analysis
+    @staticmethod
+    def _create_context_updates(
+        analysis: str,
+        parsed: Optional[Dict[str, Any]],
+        doc_type: DocumentType,
+        role: str,
+    ) -> Dict[str, Any]:
+        """Create context updates from analysis."""
+        timestamp = datetime.now().isoformat()
+        if parsed is None:
+            # If JSON parsing failed, store raw analysis
             return {
                 "document_type": doc_type,
                 "role": role,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "raw_analysis": analysis,
             }
+
+        # Create context updates based on document type and role
+        updates = {
+            "document_type": doc_type,
+            "role": role,
+            "timestamp": timestamp,
+            "analysis": parsed,  # Full analysis
+        }
+
+        # Add type-specific extracts
+        updates.update(
+            {
+                key: parsed.get(field, [])
+                for key, field in CONTEXT_EXTRACTS.get(doc_type, ())
+            }
+        )
+
+        return updates
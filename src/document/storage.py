@@ -1,10 +1,12 @@
 """Document storage management."""
 
-from typing import Dict, Any, List, Optional, Protocol
-import json
+from typing import Dict, List, Optional, Protocol
+from bisect import bisect_left
+import asyncio
+import os
 import aiofiles
 from pathlib import Path
-from datetime import datetime
+from collections import OrderedDict
 
 from .types import ProcessedDocument, DocumentType
 from .exceptions import StorageError, DocumentNotFoundError, DocumentValidationError
@@ -13,12 +15,12 @@ from .exceptions import StorageError, DocumentNotFoundError, DocumentValidationE
 class StorageBackend(Protocol):
     """Protocol for storage backend implementations."""
 
-    async def store(self, key: str, data: Dict[str, Any]) -> None:
-        """Store data with key."""
+    async def store(self, key: str, data: bytes) -> None:
+        """Store serialized data with key."""
         ...
 
-    async def retrieve(self, key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve data by key."""
+    async def retrieve(self, key: str) -> Optional[bytes]:
+        """Retrieve serialized data by key."""
         ...
 
     async def delete(self, key: str) -> None:
@@ -41,46 +43,62 @@ class FileSystemBackend:
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._base_str = os.fspath(self.base_path) + os.sep
+        # Sorted stored keys, built from one directory scan on first listing
+        self._keys: Optional[List[str]] = None
 
-    async def store(self, key: str, data: Dict[str, Any]) -> None:
+    async def store(self, key: str, data: bytes) -> None:
         """Store data in file."""
-        file_path = self.base_path / f"{key}.json"
+        file_path = self._file_path(key)
         try:
-            async with aiofiles.open(file_path, "w") as f:
-                await f.write(json.dumps(data, indent=2))
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(data)
+            if self._keys is not None:
+                index = bisect_left(self._keys, key)
+                if index == len(self._keys) or self._keys[index] != key:
+                    self._keys.insert(index, key)
         except Exception as e:
             raise StorageError(f"Failed to store document: {e}")
 
-    async def retrieve(self, key: str) -> Optional[Dict[str, Any]]:
+    async def retrieve(self, key: str) -> Optional[bytes]:
         """Retrieve data from file."""
-        file_path = self.base_path / f"{key}.json"
-        if not file_path.exists():
-            return None
-
         try:
-            async with aiofiles.open(file_path, "r") as f:
-                content = await f.read()
-                return json.loads(content)
+            async with aiofiles.open(self._file_path(key), "rb") as f:
+                return await f.read()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             raise StorageError(f"Failed to retrieve document: {e}")
 
     async def delete(self, key: str) -> None:
         """Delete file."""
-        file_path = self.base_path / f"{key}.json"
         try:
-            if file_path.exists():
-                file_path.unlink()
+            try:
+                os.unlink(self._file_path(key))
+            except FileNotFoundError:
+                pass
+            if self._keys is not None:
+                index = bisect_left(self._keys, key)
+                if index < len(self._keys) and self._keys[index] == key:
+                    del self._keys[index]
         except Exception as e:
             raise StorageError(f"Failed to delete document: {e}")
 
+    def _file_path(self, key: str) -> str:
+        """Get the file path for a key without building a Path."""
+        return f"{self._base_str}{key}.json"
+
     async def list_keys(self, prefix: Optional[str] = None) -> List[str]:
         """List stored document keys."""
         try:
-            files = list(self.base_path.glob("*.json"))
-            keys = [f.stem for f in files]
-            if prefix:
-                keys = [k for k in keys if k.startswith(prefix)]
-            return sorted(keys)
+            if self._keys is None:
+                self._keys = sorted(f.stem for f in self.base_path.glob("*.json"))
+            if not prefix:
+                return list(self._keys)
+            # Keys sharing the prefix form one contiguous sorted range
+            start = bisect_left(self._keys, prefix)
+            end = bisect_left(self._keys, prefix + "\U0010ffff", start)
+            return self._keys[start:end]
         except Exception as e:
             raise StorageError(f"Failed to list documents: {e}")
 
@@ -88,23 +106,42 @@ class FileSystemBackend:
 class DocumentStore:
     """Manages document storage and retrieval."""
 
-    def __init__(self, backend: StorageBackend, cache_size: int = 100):
+    def __init__(
+        self,
+        backend: StorageBackend,
+        cache_size: int = 100,
+        pretty: bool = False,
+        write_concurrency: int = 8,
+    ):
         """Initialize document store.
 
         Args:
             backend: Storage backend
             cache_size: Maximum cache entries
+            pretty: Store indented JSON instead of compact JSON
+            write_concurrency: Maximum concurrent backend writes on flush
         """
         self.backend = backend
         self.cache_size = cache_size
-        self.cache: Dict[str, ProcessedDocument] = {}
-        self.access_times: Dict[str, datetime] = {}
-
-    async def store_document(self, document: ProcessedDocument) -> None:
+        self.pretty = pretty
+        self.write_concurrency = write_concurrency
+        # Least recently used first
+        self.cache: OrderedDict[str, ProcessedDocument] = OrderedDict()
+        # Serialized documents waiting for flush(), latest version per ID;
+        # entries stay here until their backend write has succeeded
+        self._pending: Dict[str, bytes] = {}
+        # Orders backend writes and deletes against an in-flight flush()
+        self._write_lock = asyncio.Lock()
+
+    async def store_document(
+        self, document: ProcessedDocument, flush: bool = True
+    ) -> None:
         """Store processed document.
 
         Args:
             document: Document to store
+            flush: Write to the backend now; if False the write is
+                queued until flush() so bulk stores can be batched
 
         Raises:
             StorageError: If storage fails
@@ -112,11 +149,17 @@ class DocumentStore:
         """
         try:
             # Validate document
-            if not document.id or not document.type:
+            if not document.id or not document.doc_type:
                 raise DocumentValidationError("Missing required fields")
 
-            # Store in backend
-            await self.backend.store(document.id, document.model_dump())
+            # Serialize straight to JSON and store in backend
+            data = document.model_dump_json(indent=2 if self.pretty else None).encode()
+            if flush:
+                async with self._write_lock:
+                    self._pending.pop(document.id, None)
+                    await self.backend.store(document.id, data)
+            else:
+                self._pending[document.id] = data
 
             # Update cache
             self._update_cache(document.id, document)
@@ -141,17 +184,20 @@ class DocumentStore:
         """
         try:
             # Check cache
-            if document_id in self.cache:
-                self.access_times[document_id] = datetime.now()
-                return self.cache[document_id]
-
-            # Get from backend
-            data = await self.backend.retrieve(document_id)
+            document = self.cache.get(document_id)
+            if document is not None:
+                self.cache.move_to_end(document_id)
+                return document
+
+            # Get from pending writes or backend
+            data = self._pending.get(document_id)
+            if data is None:
+                data = await self.backend.retrieve(document_id)
             if not data:
                 raise DocumentNotFoundError(f"Document not found: {document_id}")
 
             # Create document and cache
-            document = ProcessedDocument(**data)
+            document = ProcessedDocument.model_validate_json(data)
             self._update_cache(document_id, document)
             return document
 
@@ -171,12 +217,14 @@ class DocumentStore:
             StorageError: If deletion fails
         """
         try:
-            # Remove from cache
-            self.cache.pop(document_id, None)
-            self.access_times.pop(document_id, None)
+            # Wait for any in-flight flush so it cannot re-store the document
+            async with self._write_lock:
+                # Remove from cache and pending writes
+                self.cache.pop(document_id, None)
+                self._pending.pop(document_id, None)
 
-            # Delete from backend
-            await self.backend.delete(document_id)
+                # Delete from backend
+                await self.backend.delete(document_id)
 
         except Exception as e:
             raise StorageError(f"Failed to delete document: {e}")
@@ -197,10 +245,43 @@ class DocumentStore:
         """
         try:
             prefix = f"{doc_type.value}_" if doc_type else None
-            return await self.backend.list_keys(prefix)
+            keys = await self.backend.list_keys(prefix)
+            if not self._pending:
+                return keys
+            pending = [
+                key for key in self._pending if not prefix or key.startswith(prefix)
+            ]
+            return sorted(set(keys).union(pending))
         except Exception as e:
             raise StorageError(f"Failed to list documents: {e}")
 
+    async def flush(self) -> None:
+        """Write all queued documents to the backend.
+
+        Raises:
+            StorageError: If any write fails; failed documents stay queued
+        """
+        async with self._write_lock:
+            if not self._pending:
+                return
+
+            semaphore = asyncio.Semaphore(self.write_concurrency)
+
+            async def write(doc_id: str, data: bytes) -> None:
+                async with semaphore:
+                    await self.backend.store(doc_id, data)
+                # Drop the entry unless a newer version was queued meanwhile
+                if self._pending.get(doc_id) is data:
+                    del self._pending[doc_id]
+
+            results = await asyncio.gather(
+                *(write(doc_id, data) for doc_id, data in list(self._pending.items())),
+                return_exceptions=True,
+            )
+            failed = sum(isinstance(result, Exception) for result in results)
+            if failed:
+                raise StorageError(f"Failed to store {failed} document(s)")
+
     def _update_cache(self, doc_id: str, document: ProcessedDocument) -> None:
         """Update cache with document.
 
@@ -208,12 +289,11 @@ class DocumentStore:
             doc_id: Document ID
             document: Document to cache
         """
-        # Remove the oldest if cache full
-        if len(self.cache) >= self.cache_size:
-            oldest = min(self.access_times.items(), key=lambda x: x[1])[0]
-            self.cache.pop(oldest)
-            self.access_times.pop(oldest)
+        if doc_id in self.cache:
+            self.cache.move_to_end(doc_id)
+        elif len(self.cache) >= self.cache_size:
+            # Remove the least recently used
+            self.cache.popitem(last=False)
 
         # Add to cache
         self.cache[doc_id] = document
-        self.access_times[doc_id] = datetime.now()
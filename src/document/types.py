@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentType(str, Enum):
@@ -36,6 +36,9 @@ class DocumentFormat(str, Enum):
 class Document(BaseModel):
     """Base document model."""
 
+    # Raw content is binary (PDF, DOCX, ...), so use base64 in JSON
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     content: bytes
     format: DocumentFormat
     name: str
@@ -81,6 +84,19 @@ class ProcessingResult(BaseModel):
     role_specific: Dict[str, Any] = Field(default_factory=dict)
     extracted_at: datetime = Field(default_factory=datetime.now)
 
+    def as_event_dict(self) -> Dict[str, Any]:
+        """Get a shallow summary for event payloads.
+
+        Unlike model_dump, nested values are shared rather than copied.
+        """
+        return {
+            "document_id": self.document_id,
+            "content_type": self.content_type,
+            "analysis": self.analysis,
+            "processing_time": self.processing_time,
+            "extracted_at": self.extracted_at,
+        }
+
 
 class DocumentReference(BaseModel):
     """Reference to a processed document."""
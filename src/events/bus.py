@@ -12,6 +12,7 @@ class EventBus:
     def __init__(self) -> None:
         self._subscribers: Dict[EventType, Set[CallbackType]] = {event: set() for event in EventType}
         self._queue = asyncio.Queue()
+        self._error_count = 0
 
     def subscribe(self, event_type: EventType, callback: CallbackType) -> None:
         """Subscribe to an event type."""
@@ -21,6 +22,11 @@ class EventBus:
         """Unsubscribe from an event type."""
         self._subscribers[event_type].discard(callback)
 
+    @property
+    def error_count(self) -> int:
+        """Number of subscriber callbacks that have raised."""
+        return self._error_count
+
     async def publish(self, event: Event) -> None:
         """Publish an event to all subscribers asynchronously."""
         await self._queue.put(event)
@@ -29,10 +35,22 @@ class EventBus:
         """Start processing events from the queue."""
         while True:
             event = await self._queue.get()
-            if event.type in self._subscribers:
-                for callback in self._subscribers[event.type]:
-                    try:
-                        await callback(event)
-                    except Exception as e:
-                        logger.error(f"Error in {callback}: {e}")
-            self._queue.task_done()
+            try:
+                # Snapshot so callbacks may (un)subscribe while running
+                callbacks = tuple(self._subscribers.get(event.type, ()))
+                if callbacks:
+                    # Run subscribers concurrently so one slow handler
+                    # does not hold up the others
+                    await asyncio.gather(
+                        *(self._run_callback(callback, event) for callback in callbacks)
+                    )
+            finally:
+                self._queue.task_done()
+
+    async def _run_callback(self, callback: CallbackType, event: Event) -> None:
+        """Run one subscriber, logging instead of raising on failure."""
+        try:
+            await callback(event)
+        except Exception:
+            self._error_count += 1
+            logger.exception("Subscriber %r failed on %s", callback, event.type)
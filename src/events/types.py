@@ -1,7 +1,7 @@
 # src/types.py
 from enum import Enum
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 from datetime import datetime
 
 class EventType(Enum):
@@ -19,8 +19,9 @@ class EventType(Enum):
     ANALYSIS = "analysis"
     CONVERSATION = "conversation"
 
-class Event(BaseModel):
+@dataclass(slots=True)
+class Event:
     type: EventType
     data: Dict[str, Any]
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
     metadata: Optional[Dict[str, Any]] = None
@@ -1,10 +1,61 @@
-from enum import Enum
-from typing import Dict, Any, Optional
 import json
+import logging
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Optional
 
+from src.conversation.context import ConversationContext
 from src.conversation.manager import ConversationManager
 from src.conversation.roles import Role
-from src.conversation.context import ConversationContext
+from src.document.roles import ROLES
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = (
+    "As a {role}, create a detailed summary of this conversation.\n\n"
+    "Role Context:\n{role_context}\n\n"
+    "Conversation:\n{conversation}\n\n"
+    "Include in JSON format:\n"
+    "1. Key points relevant to the role\n"
+    "2. Action items and responsibilities\n"
+    "3. Critical insights and decisions\n"
+    "4. Follow-up requirements\n"
+    "5. Role-specific recommendations"
+)
+
+VALIDATION_PROMPT = (
+    "As a {role}, incorporate this feedback into the summary.\n\n"
+    "Original Summary:\n{original}\n\n"
+    "Feedback:\n{feedback}\n\n"
+    "Provide updated summary maintaining:\n"
+    "1. Professional tone\n"
+    "2. Role-appropriate context\n"
+    "3. Key information integrity\n"
+    "4. Clear action items\n"
+    "5. Feedback incorporation"
+)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _role_context(role: Role) -> str:
+    """Describe what a role focuses on, for use in summary prompts."""
+    role_config = ROLES.get(role.value)
+    if role_config is None:
+        return role.value
+    return "Priorities: " + ", ".join(
+        priority.replace("_", " ") for priority in role_config.priorities
+    )
 
 
 class ExportFormat(Enum):
@@ -18,11 +69,16 @@ class ExportManager:
     def __init__(
         self,
         conversation_manager: ConversationManager,
-        role: Role
+        role: Role,
+        max_summaries: int = 256
     ):
         self.ai = conversation_manager
         self.role = role
-        self.validated_summaries: Dict[str, Dict[str, Any]] = {}
+        # The role is fixed for this manager, so its prompt context is too
+        self._role_context = _role_context(role)
+        # Most recently validated last; bounded by max_summaries
+        self.max_summaries = max_summaries
+        self.validated_summaries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
 
     async def export_conversation(
         self,
@@ -48,31 +104,14 @@ class ExportManager:
         context: ConversationContext
     ) -> Dict[str, Any]:
         """Generate role-specific conversation summary."""
-        conversation = "\n".join([
-            f"{turn.speaker}: {turn.content}"
-            for turn in context.turns
-        ])
-
-        prompt = (
-            f"As a {self.role.value}, create a detailed summary of this "
-            f"conversation.\n\n"
-            f"Role Context:\n{self.role.get_prompt_context()}\n\n"
-            f"Conversation:\n{conversation}\n\n"
-            "Include in JSON format:\n"
-            "1. Key points relevant to the role\n"
-            "2. Action items and responsibilities\n"
-            "3. Critical insights and decisions\n"
-            "4. Follow-up requirements\n"
-            "5. Role-specific recommendations"
+        prompt = SUMMARY_PROMPT.format(
+            role=self.role.value,
+            role_context=self._role_context,
+            conversation=context.get_transcript(),
         )
 
-        async for response in self.ai.send_message(prompt):
-            if response.text:
-                try:
-                    return json.loads(response.text)
-                except json.JSONDecodeError:
-                    continue
-        return {}
+        summary = await self._request_json(prompt)
+        return summary if summary is not None else {}
 
     async def validate_summary(
         self,
@@ -83,25 +122,45 @@ class ExportManager:
         """Update summary based on role-specific feedback."""
         original = self.validated_summaries.get(summary_id, {})
 
-        prompt = (
-            f"As a {editor_role.value}, incorporate this feedback into "
-            f"the summary.\n\n"
-            f"Original Summary:\n{json.dumps(original, indent=2)}\n\n"
-            f"Feedback:\n{feedback}\n\n"
-            "Provide updated summary maintaining:\n"
-            "1. Professional tone\n"
-            "2. Role-appropriate context\n"
-            "3. Key information integrity\n"
-            "4. Clear action items\n"
-            "5. Feedback incorporation"
+        prompt = VALIDATION_PROMPT.format(
+            role=editor_role.value,
+            original=_dumps(original),
+            feedback=feedback,
         )
 
+        updated = await self._request_json(prompt)
+        if updated is None:
+            return original
+        self.validated_summaries[summary_id] = updated
+        self.validated_summaries.move_to_end(summary_id)
+        if len(self.validated_summaries) > self.max_summaries:
+            self.validated_summaries.popitem(last=False)
+        return updated
+
+    async def _request_json(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Send prompt and parse the streamed reply as JSON.
+
+        The reply is collected in full and parsed once, rather than
+        attempting to parse each streamed fragment.
+
+        Args:
+            prompt: Prompt to send
+
+        Returns:
+            Parsed reply, or None if it is not a JSON object
+        """
+        parts = []
         async for response in self.ai.send_message(prompt):
             if response.text:
-                try:
-                    updated = json.loads(response.text)
-                    self.validated_summaries[summary_id] = updated
-                    return updated
-                except json.JSONDecodeError:
-                    continue
-        return original
+                parts.append(response.text)
+        try:
+            parsed = (orjson or json).loads("".join(parts))
+        except json.JSONDecodeError:  # orjson's error subclasses this
+            return None
+        if not isinstance(parsed, dict):
+            logger.warning(
+                "Expected a JSON object from the model, got %s",
+                type(parsed).__name__,
+            )
+            return None
+        return parsed
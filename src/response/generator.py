@@ -1,8 +1,12 @@
 """Core response generation functionality."""
-from typing import Dict, Any, List, Optional, AsyncIterator
+from typing import Dict, Any, List, Optional, AsyncIterator, FrozenSet, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime
 import asyncio
+import copy
+import hashlib
 import json
+import logging
 
 from src.conversation.manager import ConversationManager
 from src.context.manager import ContextManager
@@ -18,6 +22,45 @@ from .types import (
     ResponseResult,
     ResponseRequest
 )
+from .templates import VARIABLE_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Responses retained per session; older entries are dropped FIFO.
+MAX_SESSION_HISTORY = 256
+
+
+def _with_variables(*templates: str) -> Tuple[Tuple[str, FrozenSet[str]], ...]:
+    """Pair each template with the set of variables it references."""
+    return tuple(
+        (template, frozenset(VARIABLE_PATTERN.findall(template)))
+        for template in templates
+    )
+
+
+# Template registry - could be moved to config/database
+RESPONSE_TEMPLATES: Dict[ResponseType, Tuple[Tuple[str, FrozenSet[str]], ...]] = {
+    ResponseType.CLARIFICATION: _with_variables(
+        "Could you clarify what you mean by {topic}?",
+        "I'm not sure I understand about {topic}. Can you explain?",
+        "Just to make sure I understand correctly: {context}?"
+    ),
+    ResponseType.FOLLOW_UP: _with_variables(
+        "Based on {context}, would you like to know more about {topic}?",
+        "That's interesting. How do you feel about {topic}?",
+        "Could you tell me more about {aspect}?"
+    ),
+    ResponseType.SUGGESTION: _with_variables(
+        "Have you considered {suggestion}?",
+        "You might want to try {suggestion}.",
+        "Based on {context}, I recommend {suggestion}."
+    ),
+    ResponseType.SUMMARY: _with_variables(
+        "To summarize: {summary}",
+        "Here's what we've covered: {summary}",
+        "The main points are: {summary}"
+    )
+}
 
 
 class ResponseGenerator:
@@ -29,7 +72,9 @@ class ResponseGenerator:
         conversation_manager: ConversationManager,
         context_manager: ContextManager,
         analysis_engine: AnalysisEngine,
-        config: Optional[ResponseConfig] = None
+        config: Optional[ResponseConfig] = None,
+        cache_size: int = 1024,
+        stream_cache_size: int = 256
     ):
         """Initialize generator.
 
@@ -39,6 +84,9 @@ class ResponseGenerator:
             context_manager: Context manager
             analysis_engine: Analysis engine
             config: Optional configuration
+            cache_size: Maximum number of cached responses, 0 to disable
+            stream_cache_size: Maximum number of cached model outputs,
+                0 to disable
         """
         self.event_bus = event_bus
         self.conversation = conversation_manager
@@ -47,9 +95,17 @@ class ResponseGenerator:
         self.config = config or ResponseConfig()
 
         # Response tracking
-        self.response_history: Dict[str, List[ResponseResult]] = {}
+        self.response_history: Dict[str, deque[ResponseResult]] = {}
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
 
+        # Generated responses keyed by request and context version
+        self.cache_size = cache_size
+        self._response_cache: OrderedDict[Tuple, ResponseResult] = OrderedDict()
+
+        # Structured model output keyed by prompt digest
+        self.stream_cache_size = stream_cache_size
+        self._stream_cache: OrderedDict[bytes, str] = OrderedDict()
+
     async def generate_response(
         self,
         request: ResponseRequest
@@ -63,26 +119,42 @@ class ResponseGenerator:
             Generated responses
         """
         try:
-            # Generate candidates
-            candidates = await self._generate_candidates(request)
+            cache_key = self._cache_key(request)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                # Same query against unchanged context already answered;
+                # hand out a copy so callers never share the cached entry
+                self._response_cache.move_to_end(cache_key)
+                response = copy.deepcopy(cached)
+            else:
+                # Generate candidates
+                candidates = await self._generate_candidates(request)
+
+                # Select best candidates
+                selected = await self._select_candidates(
+                    candidates,
+                    request.config or self.config
+                )
 
-            # Select best candidates
-            selected = await self._select_candidates(
-                candidates,
-                request.config or self.config
-            )
+                # Generate final response
+                response = await self._generate_final_response(
+                    selected,
+                    request
+                )
 
-            # Generate final response
-            response = await self._generate_final_response(
-                selected,
-                request
-            )
+                if self.cache_size and response.type != ResponseType.FALLBACK:
+                    self._response_cache[cache_key] = copy.deepcopy(response)
+                    if len(self._response_cache) > self.cache_size:
+                        self._response_cache.popitem(last=False)
 
             # Track response
             session_id = self._get_session_id(request)
-            if session_id not in self.response_history:
-                self.response_history[session_id] = []
-            self.response_history[session_id].append(response)
+            history = self.response_history.get(session_id)
+            if history is None:
+                history = self.response_history[session_id] = deque(
+                    maxlen=MAX_SESSION_HISTORY
+                )
+            history.append(response)
 
             # Emit event
             # Changed EventType.RESPONSE to EventType.RESPONSE_RECEIVED
@@ -116,14 +188,18 @@ class ResponseGenerator:
         """
         candidates = []
 
-        # Generate AI-based candidates
+        # Template fills overlap with the model round trip
         ai_prompt = self._create_response_prompt(request)
-        ai_candidates = await self._get_ai_candidates(ai_prompt)
-        candidates.extend(ai_candidates)
-
-        # Generate template-based candidates
-        template_candidates = await self._get_template_candidates(request)
-        candidates.extend(template_candidates)
+        results = await asyncio.gather(
+            self._get_ai_candidates(ai_prompt),
+            self._get_template_candidates(request),
+            return_exceptions=True,
+        )
+        for source, result in zip(("AI", "template"), results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Dropping %s candidates", source, exc_info=result)
+                continue
+            candidates.extend(result)
 
         return candidates
 
@@ -140,17 +216,24 @@ class ResponseGenerator:
             Generated candidates
         """
         try:
-            responses = []
-            async for response in self.conversation.send_message(prompt):
-                if response.text:
-                    responses.append(response.text)
-
-            response_text = ''.join(responses)
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            response_text = self._stream_cache.get(cache_key)
+            cached = response_text is not None
+            if cached:
+                # Replay an earlier completed stream for the same prompt
+                self._stream_cache.move_to_end(cache_key)
+            else:
+                responses = []
+                async for response in self.conversation.send_message(prompt):
+                    if response.text:
+                        responses.append(response.text)
+
+                response_text = ''.join(responses)
 
             try:
                 # Parse structured response
                 data = json.loads(response_text)
-                return [
+                candidates = [
                     ResponseCandidate(
                         content=c["content"],
                         type=ResponseType(c.get("type", "direct")),
@@ -160,6 +243,12 @@ class ResponseGenerator:
                     )
                     for c in data.get("candidates", [])
                 ]
+                # Only well-formed output is worth replaying
+                if not cached and self.stream_cache_size:
+                    self._stream_cache[cache_key] = response_text
+                    if len(self._stream_cache) > self.stream_cache_size:
+                        self._stream_cache.popitem(last=False)
+                return candidates
             except json.JSONDecodeError:
                 # Handle unstructured response
                 return [
@@ -170,8 +259,8 @@ class ResponseGenerator:
                     )
                 ]
 
-        except Exception as e:
-            print(f"Error getting AI candidates: {e}")
+        except Exception:
+            logger.exception("Error getting AI candidates")
             return []
 
     async def _get_template_candidates(
@@ -192,107 +281,84 @@ class ResponseGenerator:
         response_type = request.response_type or self.config.default_type
         templates = self._get_templates(response_type)
 
-        for template in templates:
-            try:
-                # Fill template with context
-                content = await self._fill_template(
-                    template,
-                    request
-                )
-                if content:
-                    candidates.append(
-                        ResponseCandidate(
-                            content=content,
-                            type=response_type,
-                            confidence=0.7,  # Template confidence
-                            context_refs=[],  # Add relevant refs
-                            metadata={"source": "template"}
-                        )
-                    )
-            except Exception as e:
-                print(f"Template fill error: {e}")
+        # Fill templates with context concurrently
+        contents = await asyncio.gather(
+            *(
+                self._fill_template(template, variables, request)
+                for template, variables in templates
+            ),
+            return_exceptions=True,
+        )
+        for content in contents:
+            if isinstance(content, Exception):
+                logger.error("Template fill error", exc_info=content)
                 continue
+            if content:
+                candidates.append(
+                    ResponseCandidate(
+                        content=content,
+                        type=response_type,
+                        confidence=0.7,  # Template confidence
+                        context_refs=[],  # Add relevant refs
+                        metadata={"source": "template"},
+                    )
+                )
 
         return candidates
 
     def _get_templates(
         self,
         response_type: ResponseType
-    ) -> List[str]:
+    ) -> Tuple[Tuple[str, FrozenSet[str]], ...]:
         """Get templates for response type.
 
         Args:
             response_type: Type of response
 
         Returns:
-            List of templates
+            Templates paired with the variables they reference
         """
-        # Template registry - could be moved to config/database
-        templates = {
-            ResponseType.CLARIFYING: [
-                "Could you clarify what you mean by {topic}?",
-                "I'm not sure I understand about {topic}. Can you explain?",
-                "Just to make sure I understand correctly: {context}?"
-            ],
-            ResponseType.FOLLOW_UP: [
-                "Based on {context}, would you like to know more about {topic}?",
-                "That's interesting. How do you feel about {topic}?",
-                "Could you tell me more about {aspect}?"
-            ],
-            ResponseType.SUGGESTION: [
-                "Have you considered {suggestion}?",
-                "You might want to try {suggestion}.",
-                "Based on {context}, I recommend {suggestion}."
-            ],
-            ResponseType.SUMMARY: [
-                "To summarize: {summary}",
-                "Here's what we've covered: {summary}",
-                "The main points are: {summary}"
-            ]
-        }
-        return templates.get(response_type, [])
+        return RESPONSE_TEMPLATES.get(response_type, ())
 
     async def _fill_template(
         self,
         template: str,
+        vars_needed: FrozenSet[str],
         request: ResponseRequest
     ) -> Optional[str]:
         """Fill template with context.
 
         Args:
             template: Template to fill
+            vars_needed: Variables referenced by the template
             request: Response request
 
         Returns:
             Filled template if successful
         """
         try:
-            # Extract variables from template
-            vars_needed = {
-                var.strip('{}')
-                for var in template.split()
-                if var.startswith('{') and var.endswith('}')
-            }
-
             # Get values from context
             values = {}
             if request.context:
-                for var in vars_needed:
-                    value = await self._extract_value(
-                        var,
-                        request.context,
-                        request.analysis
+                extracted = await asyncio.gather(
+                    *(
+                        self._extract_value(var, request.context, request.analysis)
+                        for var in vars_needed
                     )
-                    if value:
-                        values[var] = value
+                )
+                values = {
+                    var: value
+                    for var, value in zip(vars_needed, extracted, strict=True)
+                    if value
+                }
 
             # Fill template if we have all values
             if len(values) == len(vars_needed):
                 return template.format(**values)
             return None
 
-        except Exception as e:
-            print(f"Template fill error: {e}")
+        except Exception:
+            logger.exception("Template fill error")
             return None
 
     async def _select_candidates(
@@ -398,6 +464,34 @@ class ResponseGenerator:
             }
         )
 
+    @staticmethod
+    def _cache_key(request: ResponseRequest) -> Tuple:
+        """Build the response cache key for a request.
+
+        Context and analysis are identified by id and timestamp, so an
+        updated context entry no longer matches earlier responses. The
+        generation config, priority and metadata are part of the key
+        because they change candidate selection.
+
+        Args:
+            request: Response request
+
+        Returns:
+            Hashable cache key
+        """
+        context = request.context
+        analysis = request.analysis
+        return (
+            request.query,
+            request.response_type,
+            request.role,
+            (context.id, context.metadata.timestamp) if context else None,
+            (analysis.task_id, analysis.timestamp) if analysis else None,
+            request.priority,
+            request.config.model_dump_json() if request.config else None,
+            json.dumps(request.metadata, sort_keys=True, default=str),
+        )
+
     def _get_session_id(self, request: ResponseRequest) -> str:
         """Get session ID from request.
 
@@ -18,6 +18,8 @@ from .types import (
 )
 from .exceptions import TemplateError
 
+VARIABLE_PATTERN = re.compile(r'\{([^}]+)\}')
+
 
 class TemplateManager:
     """Manages response templates."""
@@ -25,7 +27,7 @@ class TemplateManager:
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.templates: Dict[str, ResponseTemplate] = {}
-        self._variable_pattern = re.compile(r'\{([^}]+)\}')
+        self._variable_pattern = VARIABLE_PATTERN
         self._setup_default_templates()
 
     async def render_template(
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.analysis.specialized_analyzers import (
+    INTERACTION_INDICATORS,
+    BehavioralAnalyzer,
+)
+
+
+@pytest.fixture
+def analyzer():
+    return BehavioralAnalyzer(conversation_manager=MagicMock())
+
+
+def detect_by_phrase(text):
+    """Reference detection checking every phrase as a substring."""
+    return [
+        {"type": pattern_type, "strength": strength}
+        for pattern_type, strength, indicators in INTERACTION_INDICATORS
+        if any(indicator in text for indicator in indicators)
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "as you said, we could try another approach",
+        "building on that, how about we fix the build and optimize it",
+        "nothing relevant here",
+        # "fix" overlaps the end of "what if"
+        "what ifix",
+    ],
+)
+def test_interaction_patterns_match_per_phrase_checks(analyzer, text):
+    assert analyzer._detect_interaction_patterns(text) == detect_by_phrase(text)
+
+
+def test_overlapping_phrases_report_both_types(analyzer):
+    patterns = analyzer._detect_interaction_patterns("what ifix")
+
+    assert [p["type"] for p in patterns] == ["active_discussion", "problem_solving"]
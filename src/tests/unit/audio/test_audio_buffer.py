@@ -1,5 +1,6 @@
 import asyncio
 
+import numpy as np
 import pytest
 
 from src.audio.buffer import AudioBuffer
@@ -113,3 +114,72 @@ async def test_invalid_channel(buffer):
 
     with pytest.raises(BufferError, match="Invalid channel: ch_2"):
         await buffer.read(size=100, channel="ch_2")
+
+
+@pytest.mark.asyncio
+async def test_read_timeout_wakes_on_write(buffer):
+    data = b"\x00\x01\x02\x03" * 50
+
+    async def write_later():
+        await asyncio.sleep(0.05)
+        await buffer.write(data)
+
+    writer = asyncio.create_task(write_later())
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    read_data = await buffer.read(size=len(data), timeout=2.0)
+    await writer
+
+    assert read_data == data
+    # Woken by the write, not by the timeout expiring
+    assert loop.time() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_read_timeout_expires_without_data(buffer):
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    read_data = await buffer.read(size=400, timeout=0.05)
+
+    assert read_data is None
+    assert loop.time() - started >= 0.05
+    assert buffer.get_status().metrics.underrun_count == 1
+
+
+@pytest.mark.asyncio
+async def test_read_stream_wakes_on_write(event_bus, audio_config):
+    # Large enough to hold a full default-size chunk
+    buffer = AudioBuffer(event_bus, audio_config, max_size=32768)
+    stream = buffer.read_stream()
+    next_chunk = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0.01)
+    assert not next_chunk.done()
+
+    data = b"\x00\x01\x02\x03" * (buffer.chunk_size // 4)
+    await buffer.write(data)
+    chunk = await asyncio.wait_for(next_chunk, timeout=1.0)
+
+    assert chunk == data
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stereo_deinterleave_matches_numpy(event_bus, audio_config):
+    buffer = AudioBuffer(event_bus, audio_config, max_size=32768)
+    samples = np.arange(-600, 600, dtype=np.int16)
+    stereo_data = samples.tobytes()
+    await buffer.write(stereo_data)
+    # A trailing partial frame is dropped from the channel buffers
+    await buffer._split_stereo_channels(stereo_data + b"\x7f\x7f")
+
+    frames = samples.reshape(-1, 2)
+    expected_left = frames[:, 0].tobytes()
+    expected_right = frames[:, 1].tobytes()
+
+    # One chunk per channel per write, not one per sample
+    assert len(buffer._buffers["ch_0"]) == 2
+    left = await buffer.read(channel="ch_0", size=2 * len(expected_left))
+    right = await buffer.read(channel="ch_1", size=2 * len(expected_right))
+
+    assert left == expected_left * 2
+    assert right == expected_right * 2
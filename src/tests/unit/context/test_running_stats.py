@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from src.context.utils import RunningStats
+
+
+def test_empty_stats():
+    stats = RunningStats()
+
+    assert stats.count == 0
+    assert stats.mean == 0.0
+    assert stats.variance == 0.0
+
+
+def test_single_sample_has_zero_variance():
+    stats = RunningStats()
+    stats.add(0.25)
+
+    assert stats.mean == 0.25
+    assert stats.variance == 0.0
+
+
+def test_matches_numpy():
+    rng = np.random.default_rng(7)
+    # Large offset with small spread is where naive sum-of-squares breaks down
+    samples = 1e6 + rng.normal(0.0, 0.01, size=5000)
+
+    stats = RunningStats()
+    for value in samples:
+        stats.add(float(value))
+
+    assert stats.count == len(samples)
+    assert stats.mean == pytest.approx(np.mean(samples), rel=1e-12)
+    assert stats.variance == pytest.approx(np.var(samples, ddof=1), rel=1e-6)
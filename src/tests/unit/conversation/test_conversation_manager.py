@@ -0,0 +1,57 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.conversation.manager import ConversationManager
+from src.conversation.types import ContentBlock, InferenceConfig, Message, Request
+
+MODEL_ID = "test-model"
+
+
+def make_pool(events):
+    async def stream():
+        for event in events:
+            yield event
+
+    client = MagicMock()
+    client.converse_stream = AsyncMock(return_value={"stream": stream()})
+
+    @asynccontextmanager
+    async def get_client(client_type):
+        yield client
+
+    pool = MagicMock()
+    pool.get_client = get_client
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_pre_processing_skips_empty_deltas():
+    events = [
+        {"contentBlockDelta": {"delta": {"text": '{"a": '}}},
+        {"contentBlockDelta": {"delta": {}}},
+        {"contentBlockDelta": {"delta": {"text": ""}}},
+        {"contentBlockDelta": {"delta": {"text": "1}"}}},
+        {"messageStop": {"stopReason": "end_turn"}},
+    ]
+    manager = ConversationManager(
+        event_bus=MagicMock(), client_pool=make_pool(events), model_id=MODEL_ID
+    )
+    request = Request(
+        modelId=MODEL_ID,
+        messages=[Message(role="user", content=[ContentBlock(text="analyze")])],
+        inferenceConfig=InferenceConfig(),
+    )
+
+    stream = manager.send_message(message=request, client_type="pre_processing")
+    # Stub the follow-up context updates issued after messageStop
+    manager.config = MagicMock(model_id=MODEL_ID)
+    manager.send_message = AsyncMock()
+
+    chunks = [chunk async for chunk in stream]
+
+    assert chunks == ['{"a": ', "1}"]
+    for call in manager.send_message.await_args_list:
+        assert call.kwargs["message"].messages[0].content[0].text == '{"a": 1}'
+    assert manager.send_message.await_count == 3
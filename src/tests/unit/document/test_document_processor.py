@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.document.types import (
+    Document,
+    DocumentFormat,
+    DocumentType,
+    ProcessingContext,
+)
+
+# The processor only imports once its upstream modules do
+processor_module = pytest.importorskip("src.document.processor", exc_type=ImportError)
+DocumentProcessor = processor_module.DocumentProcessor
+
+
+def make_document(name):
+    return Document(
+        content=b"%PDF same bytes",
+        format=DocumentFormat.PDF,
+        name=name,
+        doc_type=DocumentType.CV,
+    )
+
+
+@pytest.fixture
+def processor():
+    async def send_message(message, client_type):
+        await asyncio.sleep(0.01)
+        yield '{"technical_skills": ["python"]}'
+
+    conversation = MagicMock()
+    conversation.send_message = MagicMock(side_effect=send_message)
+    return DocumentProcessor(
+        conversation_manager=conversation,
+        context_manager=MagicMock(),
+        event_bus=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_refreshes_timing(processor):
+    context = ProcessingContext(
+        role="interviewer", document_type=DocumentType.CV, purpose="screening"
+    )
+
+    first = await processor.process_document(make_document("a.pdf"), context)
+    second = await processor.process_document(make_document("b.pdf"), context)
+
+    processor.conversation.send_message.assert_called_once()
+    assert second.document_id == "b.pdf"
+    assert second.analysis == first.analysis
+    assert second.processing_time < first.processing_time
+    assert second.extracted_at > first.extracted_at
+    assert second.context_updates["timestamp"] > first.context_updates["timestamp"]
+    assert second.context_updates["skills"] == ["python"]
+    # The cached result is left untouched
+    assert processor._results[next(iter(processor._results))] is first
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from src.document.roles import ROLES
+from src.document.types import DocumentType
+
+
+@pytest.mark.parametrize("role_name", sorted(ROLES))
+def test_every_prompt_has_response_format(role_name):
+    role = ROLES[role_name]
+
+    assert set(role.response_format) == set(role.system_prompts)
+    for doc_type in role.system_prompts:
+        assert json.loads(role.response_format_text[doc_type])
+
+
+@pytest.mark.parametrize(
+    ("role_name", "doc_type", "keys"),
+    [
+        (
+            "customer",
+            DocumentType.SUPPORT_GUIDE,
+            {
+                "information_to_prepare",
+                "self_service",
+                "response_times",
+                "escalation_options",
+            },
+        ),
+        (
+            "interviewer",
+            DocumentType.JOB_DESCRIPTION,
+            {"core_requirements", "technical_competencies", "success_criteria"},
+        ),
+        (
+            "support_agent",
+            DocumentType.SUPPORT_GUIDE,
+            {"procedures", "escalation", "customer_communication"},
+        ),
+        (
+            "meeting_participant",
+            DocumentType.TECHNICAL_SPEC,
+            {
+                "technical_requirements",
+                "discussion_points",
+                "decisions_needed",
+                "implementation_considerations",
+            },
+        ),
+    ],
+)
+def test_response_format_schema(role_name, doc_type, keys):
+    role = ROLES[role_name]
+
+    assert set(role.response_format[doc_type]) == keys
+    assert json.loads(role.response_format_text[doc_type]) == (
+        role.response_format[doc_type]
+    )
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from src.document.exceptions import DocumentNotFoundError, StorageError
+from src.document.storage import DocumentStore, FileSystemBackend
+from src.document.types import (
+    Document,
+    DocumentFormat,
+    DocumentType,
+    ProcessedDocument,
+)
+
+
+class MemoryBackend:
+    """In-memory backend whose writes can be held open by the test."""
+
+    def __init__(self):
+        self.data = {}
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = set()
+
+    async def store(self, key, data):
+        await self.release.wait()
+        if key in self.fail:
+            raise OSError("disk full")
+        self.data[key] = data
+
+    async def retrieve(self, key):
+        return self.data.get(key)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def list_keys(self, prefix=None):
+        return sorted(k for k in self.data if not prefix or k.startswith(prefix))
+
+
+def make_document(doc_id, doc_type=DocumentType.CV):
+    return ProcessedDocument(
+        id=doc_id,
+        original=Document(
+            content=b"\x00raw bytes",
+            format=DocumentFormat.PDF,
+            name=f"{doc_id}.pdf",
+            doc_type=doc_type,
+        ),
+        doc_type=doc_type,
+        analysis={},
+        role_specific={},
+        metadata={},
+        references=[],
+        confidence=0.9,
+    )
+
+
+@pytest.fixture
+def backend():
+    return MemoryBackend()
+
+
+@pytest.fixture
+def store(backend):
+    return DocumentStore(backend, cache_size=1)
+
+
+@pytest.mark.asyncio
+async def test_deferred_store_visible_before_flush(store, backend):
+    await store.store_document(make_document("cv_1"), flush=False)
+    await store.store_document(make_document("cv_2"), flush=False)
+
+    assert backend.data == {}
+    # cv_1 was evicted from the one-entry cache but is still pending
+    assert (await store.get_document("cv_1")).id == "cv_1"
+    assert await store.list_documents(DocumentType.CV) == ["cv_1", "cv_2"]
+
+    await store.flush()
+
+    assert set(backend.data) == {"cv_1", "cv_2"}
+    assert store._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_pending_document_readable_during_flush(store, backend):
+    await store.store_document(make_document("cv_1"), flush=False)
+    await store.store_document(make_document("cv_2"), flush=False)
+    backend.release.clear()
+
+    flush = asyncio.create_task(store.flush())
+    await asyncio.sleep(0)
+
+    assert (await store.get_document("cv_1")).id == "cv_1"
+
+    backend.release.set()
+    await flush
+    assert store._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_during_flush_is_not_undone(store, backend):
+    await store.store_document(make_document("cv_1"), flush=False)
+    backend.release.clear()
+
+    flush = asyncio.create_task(store.flush())
+    await asyncio.sleep(0)
+    delete = asyncio.create_task(store.delete_document("cv_1"))
+    await asyncio.sleep(0)
+
+    backend.release.set()
+    await asyncio.gather(flush, delete)
+
+    assert "cv_1" not in backend.data
+    with pytest.raises(DocumentNotFoundError):
+        await store.get_document("cv_1")
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_stay_pending(store, backend):
+    await store.store_document(make_document("cv_1"), flush=False)
+    await store.store_document(make_document("cv_2"), flush=False)
+    backend.fail.add("cv_2")
+
+    with pytest.raises(StorageError):
+        await store.flush()
+
+    assert list(store._pending) == ["cv_2"]
+    assert "cv_1" in backend.data
+
+    backend.fail.clear()
+    await store.flush()
+    assert store._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_key_index_prefix_queries(tmp_path):
+    fs = FileSystemBackend(str(tmp_path))
+    for key in ("cv_2", "cv_1", "job_description_1", "code_1"):
+        (tmp_path / f"{key}.json").write_bytes(b"{}")
+
+    assert await fs.list_keys() == ["code_1", "cv_1", "cv_2", "job_description_1"]
+    assert await fs.list_keys("cv_") == ["cv_1", "cv_2"]
+    assert await fs.list_keys("missing_") == []
+
+
+@pytest.mark.asyncio
+async def test_key_index_tracks_store_and_delete(tmp_path):
+    fs = FileSystemBackend(str(tmp_path))
+    await fs.store("cv_2", b"{}")
+    # First listing builds the index from disk
+    assert await fs.list_keys("cv_") == ["cv_2"]
+
+    await fs.store("cv_1", b"{}")
+    await fs.store("cv_1", b"{}")  # Overwrite does not duplicate the key
+    await fs.store("general_1", b"{}")
+    assert await fs.list_keys() == ["cv_1", "cv_2", "general_1"]
+
+    await fs.delete("cv_2")
+    await fs.delete("cv_2")  # Deleting a missing key is a no-op
+    assert await fs.list_keys("cv_") == ["cv_1"]
+    assert await fs.retrieve("cv_2") is None
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["cv_1", "general_1"]
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from src.events.bus import EventBus
+from src.events.types import Event, EventType
+
+
+@pytest.fixture
+def event_bus():
+    return EventBus()
+
+
+@pytest.mark.asyncio
+async def test_failing_subscribers_do_not_stop_bus(event_bus):
+    received = []
+
+    async def good(event):
+        received.append(event)
+
+    async def raises(event):
+        raise RuntimeError("subscriber failed")
+
+    def not_awaitable(event):
+        return None
+
+    event_bus.subscribe(EventType.TRANSCRIPT, good)
+    event_bus.subscribe(EventType.TRANSCRIPT, raises)
+    event_bus.subscribe(EventType.TRANSCRIPT, not_awaitable)
+
+    task = asyncio.create_task(event_bus.start())
+    try:
+        await event_bus.publish(Event(type=EventType.TRANSCRIPT, data={"n": 1}))
+        await event_bus.publish(Event(type=EventType.TRANSCRIPT, data={"n": 2}))
+        await asyncio.wait_for(event_bus._queue.join(), timeout=1.0)
+    finally:
+        task.cancel()
+
+    assert [event.data["n"] for event in received] == [1, 2]
+    assert event_bus.error_count == 4
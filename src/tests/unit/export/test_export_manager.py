@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.conversation.types import Role
+
+# The export package only imports once its upstream modules do
+manager_module = pytest.importorskip("src.export.manager", exc_type=ImportError)
+ExportManager = manager_module.ExportManager
+
+
+def reply(*chunks):
+    async def send_message(prompt):
+        for chunk in chunks:
+            yield SimpleNamespace(text=chunk)
+
+    return MagicMock(side_effect=send_message)
+
+
+@pytest.mark.parametrize("role", list(Role))
+def test_construction_builds_role_context(role):
+    manager = ExportManager(conversation_manager=MagicMock(), role=role)
+
+    assert manager._role_context.startswith("Priorities: ")
+
+
+@pytest.mark.asyncio
+async def test_summary_prompt_includes_role_context():
+    ai = MagicMock()
+    ai.send_message = reply('{"key_points": ', "[]}")
+    manager = ExportManager(conversation_manager=ai, role=Role.INTERVIEWER)
+    context = MagicMock(get_transcript=MagicMock(return_value="Hello"))
+
+    summary = await manager._generate_summary(context)
+
+    assert summary == {"key_points": []}
+    [prompt] = ai.send_message.call_args.args
+    assert "Priorities: technical skills, experience" in prompt
+
+
+@pytest.mark.asyncio
+async def test_non_object_reply_is_rejected():
+    ai = MagicMock()
+    ai.send_message = reply("[1, 2]")
+    manager = ExportManager(conversation_manager=ai, role=Role.CUSTOMER)
+
+    assert await manager._request_json("prompt") is None
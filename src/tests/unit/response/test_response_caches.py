@@ -0,0 +1,139 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# The response package only imports once its upstream modules do
+generator_module = pytest.importorskip("src.response.generator", exc_type=ImportError)
+ResponseGenerator = generator_module.ResponseGenerator
+ResponseType = generator_module.ResponseType
+
+
+def make_request(**overrides):
+    request = {
+        "query": "How do I reset my password?",
+        "role": None,
+        "response_type": ResponseType.DIRECT,
+        "priority": 1.0,
+        "context": None,
+        "analysis": None,
+        "config": None,
+        "metadata": {},
+    }
+    request.update(overrides)
+    return SimpleNamespace(**request)
+
+
+def make_config(min_confidence):
+    return MagicMock(
+        model_dump_json=MagicMock(return_value=f'{{"min": {min_confidence}}}')
+    )
+
+
+@pytest.fixture
+def generator():
+    generator = ResponseGenerator(
+        event_bus=AsyncMock(),
+        conversation_manager=MagicMock(),
+        context_manager=MagicMock(),
+        analysis_engine=MagicMock(),
+        config=SimpleNamespace(default_type=ResponseType.DIRECT),
+    )
+    generator._generate_candidates = AsyncMock(return_value=[])
+    generator._select_candidates = AsyncMock(return_value=[])
+    generator._generate_final_response = AsyncMock(
+        side_effect=lambda selected, request: SimpleNamespace(
+            content="Use the reset link.",
+            type=ResponseType.DIRECT,
+            confidence=0.9,
+            alternatives=[],
+        )
+    )
+    return generator
+
+
+async def collect(generator, request):
+    return [response async for response in generator.generate_response(request)]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_hit_returns_copy(generator):
+    request = make_request()
+
+    [first] = await collect(generator, request)
+    [second] = await collect(generator, request)
+
+    generator._generate_candidates.assert_awaited_once()
+    assert second.content == first.content
+    assert second is not first
+    tracked = [r for history in generator.response_history.values() for r in history]
+    assert tracked[0] is first
+    assert tracked[-1] is second
+    cached = list(generator._response_cache.values())
+    assert all(r is not c for r in tracked for c in cached)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_miss_on_different_config(generator):
+    await collect(generator, make_request(config=make_config(0.5)))
+    await collect(generator, make_request(config=make_config(0.9)))
+
+    assert generator._generate_candidates.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_fallbacks(generator):
+    generator._generate_final_response = AsyncMock(
+        return_value=SimpleNamespace(type=ResponseType.FALLBACK, confidence=0.5)
+    )
+    request = make_request()
+
+    await collect(generator, request)
+    await collect(generator, request)
+
+    assert generator._generate_candidates.await_count == 2
+
+
+def test_cache_key_tracks_context_version():
+    now = datetime.now()
+    context = SimpleNamespace(id="ctx_1", metadata=SimpleNamespace(timestamp=now))
+    key = ResponseGenerator._cache_key(make_request(context=context))
+
+    context.metadata.timestamp = now + timedelta(seconds=1)
+
+    assert ResponseGenerator._cache_key(make_request(context=context)) != key
+
+
+def stream_of(*chunks):
+    async def send_message(prompt):
+        for chunk in chunks:
+            yield SimpleNamespace(text=chunk)
+
+    return MagicMock(side_effect=send_message)
+
+
+@pytest.mark.asyncio
+async def test_stream_cache_replays_structured_output(generator):
+    payload = json.dumps({"candidates": [{"content": "Try the reset link."}]})
+    generator.conversation.send_message = stream_of(payload[:10], payload[10:])
+
+    first = await generator._get_ai_candidates("prompt")
+    second = await generator._get_ai_candidates("prompt")
+
+    generator.conversation.send_message.assert_called_once()
+    assert [c.content for c in first] == [c.content for c in second]
+
+    await generator._get_ai_candidates("another prompt")
+    assert generator.conversation.send_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_cache_ignores_unstructured_output(generator):
+    generator.conversation.send_message = stream_of("not ", "json")
+
+    await generator._get_ai_candidates("prompt")
+    await generator._get_ai_candidates("prompt")
+
+    assert generator.conversation.send_message.call_count == 2
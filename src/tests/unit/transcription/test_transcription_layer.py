@@ -158,3 +158,46 @@ def test_cleanup_session(transcription_store):
     assert session_id not in transcription_store.sessions
     assert session_id not in transcription_store.partial_results
     assert session_id not in transcription_store.results
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_reports_to_on_error_once(
+    mock_event_bus, transcription_store
+):
+    on_result = AsyncMock(side_effect=RuntimeError("result callback failed"))
+    on_error = MagicMock()
+    handler = TranscriptionHandler(
+        event_bus=mock_event_bus,
+        output_stream=None,
+        store=transcription_store,
+        session_id="test_session",
+        on_result=on_result,
+        on_error=on_error,
+    )
+
+    await handler._call_callback(on_result, "data")
+
+    on_error.assert_called_once()
+    error = on_error.call_args.args[0]
+    assert "result callback failed" in error.error["message"]
+
+
+@pytest.mark.asyncio
+async def test_failing_on_error_does_not_recurse(mock_event_bus, transcription_store):
+    on_result = MagicMock(side_effect=RuntimeError("result callback failed"))
+    on_error = AsyncMock(side_effect=RuntimeError("on_error failed"))
+    handler = TranscriptionHandler(
+        event_bus=mock_event_bus,
+        output_stream=None,
+        store=transcription_store,
+        session_id="test_session",
+        on_result=on_result,
+        on_error=on_error,
+    )
+
+    # Neither call raises or re-reports the on_error failure to itself
+    await handler._call_callback(on_result, "data")
+    assert on_error.await_count == 1
+
+    await handler._call_callback(on_error, "data")
+    assert on_error.await_count == 2
@@ -16,6 +16,9 @@ from .exceptions import StreamingError, ConfigurationError, ConnectionError
 from src.events.bus import EventBus
 from src.events.types import Event, EventType
 
+# Seconds stop_stream waits for the handler to drain final results
+HANDLER_DRAIN_TIMEOUT = 2.0
+
 
 class TranscribeManager:
     """Manages AWS Transcribe streaming sessions."""
@@ -41,6 +44,7 @@ class TranscribeManager:
         self.current_handler = None
         self.state = TranscriptionState.IDLE
         self._error = None
+        self._handler_task: Optional[asyncio.Task] = None
 
     async def __aenter__(self):
         """Enter async context."""
@@ -123,7 +127,7 @@ class TranscribeManager:
             )
 
             # Start handler
-            asyncio.create_task(self._run_handler())
+            self._handler_task = asyncio.create_task(self._run_handler())
             self.state = TranscriptionState.STREAMING
 
             return session_id
@@ -197,6 +201,14 @@ class TranscribeManager:
             if self.current_stream:
                 await self.current_stream.input_stream.end_stream()
 
+            # Let the handler drain final results, then make sure it is gone
+            if self._handler_task:
+                task, self._handler_task = self._handler_task, None
+                await asyncio.wait({task}, timeout=HANDLER_DRAIN_TIMEOUT)
+                if not task.done():
+                    task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
             # Get final results if session specified
             results = None
             if session_id:
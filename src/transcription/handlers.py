@@ -1,6 +1,7 @@
 """Transcription event and stream handlers."""
 
 import asyncio
+import logging
 from dataclasses import asdict
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timedelta
@@ -21,6 +22,8 @@ from .exceptions import ResultError
 from src.events.types import Event, EventType
 from src.events.bus import EventBus
 
+logger = logging.getLogger(__name__)
+
 
 class TranscriptionHandler(TranscriptResultStreamHandler):
     """Enhanced transcription handler with speaker separation."""
@@ -41,6 +44,13 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
         self.on_result = on_result
         self.on_error = on_error
 
+        # Classify callbacks once instead of on every invocation
+        self._async_callbacks = {
+            callback
+            for callback in (on_result, on_error)
+            if callback is not None and asyncio.iscoroutinefunction(callback)
+        }
+
         # Track partial results by ResultId
         self._partial_results: Dict[str, Dict[str, Any]] = {}
 
@@ -56,11 +66,13 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
     async def handle_transcript_event(self, transcript_event: TranscriptEvent) -> None:
         """Process transcript events from AWS Transcribe stream."""
         try:
+            # One wall-clock read per event batch, shared by all its results
+            now = datetime.now()
             for result in transcript_event.transcript.results:
                 if result.is_partial:
-                    await self._handle_partial_result(result)
+                    await self._handle_partial_result(result, now)
                 else:
-                    await self._handle_complete_result(result)
+                    await self._handle_complete_result(result, now)
 
         except Exception as e:
             if self.on_error:
@@ -70,7 +82,9 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
                 )
             raise ResultError(f"Failed to handle transcript: {e}")
 
-    async def _handle_partial_result(self, result) -> None:
+    async def _handle_partial_result(
+        self, result, timestamp: Optional[datetime] = None
+    ) -> None:
         """Handle partial result updates."""
         result_id = result.result_id
         alternative = result.alternatives[0]
@@ -91,7 +105,7 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
             "is_partial": True,
             "speaker_segments": speaker_segments,
             "avg_confidence": avg_confidence,
-            "timestamp": datetime.now(),
+            "timestamp": timestamp or datetime.now(),
         }
 
         # Check for significant changes
@@ -111,7 +125,9 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
         self._processed_events += 1
         await self._maybe_cleanup()
 
-    async def _handle_complete_result(self, result) -> None:
+    async def _handle_complete_result(
+        self, result, timestamp: Optional[datetime] = None
+    ) -> None:
         """Handle complete/final result."""
         result_id = result.result_id
         alternative = result.alternatives[0]
@@ -133,7 +149,7 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
             speaker_segments=speaker_segments,
             is_partial=False,  # Maybe change to get it from the result
             avg_confidence=avg_confidence,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
         )
 
         # Clean up partial tracking
@@ -276,15 +292,23 @@ class TranscriptionHandler(TranscriptResultStreamHandler):
     async def _call_callback(self, callback: Callable, data: Any) -> None:
         """Safely execute callback function."""
         try:
-            if asyncio.iscoroutinefunction(callback):
+            if callback in self._async_callbacks:
                 await callback(data)
             else:
                 callback(data)
         except Exception as e:
-            if self.on_error:
-                await self._call_callback(
-                    self.on_error,
-                    TranscriptionStreamResponse(
-                        error={"message": f"Callback error: {e}"}
-                    ),
-                )
+            if not self.on_error or callback is self.on_error:
+                logger.error("Transcription callback %r failed", callback, exc_info=e)
+                return
+            # Report through on_error directly; a failing on_error is logged
+            # rather than re-reported to itself
+            error = TranscriptionStreamResponse(
+                error={"message": f"Callback error: {e}"}
+            )
+            try:
+                if self.on_error in self._async_callbacks:
+                    await self.on_error(error)
+                else:
+                    self.on_error(error)
+            except Exception:
+                logger.exception("Transcription on_error callback failed")
@@ -38,7 +38,7 @@ class TranscriptionConfig:
     channel_identification_mode: str = "speakers"  # or "channels"
 
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     """Word-level transcription data."""
 
@@ -50,7 +50,7 @@ class Word:
     stable: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeakerSegment:
     """Speaker-specific segment of transcription."""
 
@@ -61,7 +61,7 @@ class SpeakerSegment:
     avg_confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
     """A segment of transcription."""
 
@@ -76,7 +76,7 @@ class TranscriptionSegment:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Complete transcription result."""
 